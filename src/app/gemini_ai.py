@@ -6,7 +6,157 @@ guides, Q&A, flashcards, and highlighted insights. It also provides a chat
 functionality to interact with the transcript content.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 import google.generativeai as genai
+from google.generativeai import client as genai_client
+
+# Maximum number of generated responses kept in memory per client
+RESPONSE_CACHE_SIZE = 128
+
+# Context caching needs a versioned model and a minimum of 32k input tokens,
+# estimated here at roughly four characters per token
+CONTEXT_CACHE_MODEL = "models/gemini-1.5-flash-001"
+CONTEXT_CACHE_MIN_CHARS = 32768 * 4
+CONTEXT_CACHE_TTL = timedelta(hours=1)
+
+# A primed transcript is treated as expired this long before the service
+# drops it, so requests already on their way do not race the expiry
+CONTEXT_CACHE_EXPIRY_MARGIN = timedelta(minutes=5)
+
+# Transcripts kept as cached context per client at once, across all sessions
+CONTEXT_CACHE_SLOTS = 4
+
+# Stands in for the transcript in prompts once it lives in the cached context
+CACHED_TRANSCRIPT_REFERENCE = "(The full video transcript is provided in your context.)"
+
+# Prompt template and failure message for each insight type. Templates
+# receive the transcript as ``{text}``.
+PROMPTS = {
+    "summary": (
+        """
+        Please provide a comprehensive summary of the following video transcript:
+        
+        {text}
+        
+        Include:
+        1. Main topics discussed
+        2. Key points and insights
+        3. Important conclusions or takeaways
+        
+        Keep the summary clear and well-structured.
+        """,
+        "Error generating summary",
+    ),
+    "quotes": (
+        """
+        From the following transcript, extract 5-10 of the most important and impactful quotes:
+        
+        {text}
+        
+        Format each quote as:
+        "Quote text" - [Approximate timestamp if available]
+        
+        Focus on quotes that:
+        - Capture main ideas
+        - Are memorable or impactful
+        - Represent key insights
+        """,
+        "Error extracting quotes",
+    ),
+    "study_guide": (
+        """
+        Create a comprehensive study guide from this video transcript:
+        
+        {text}
+        
+        Structure the study guide with:
+        1. Main Topics/Chapters
+        2. Key Concepts and Definitions
+        3. Important Facts and Figures
+        4. Study Questions
+        5. Review Points
+        
+        Make it suitable for learning and revision.
+        """,
+        "Error creating study guide",
+    ),
+    "qa": (
+        """
+        Create a Q&A session based on this video transcript:
+        
+        {text}
+        
+        Generate 10-15 relevant questions and provide detailed answers based on the content.
+        Format as:
+        
+        Q: [Question]
+        A: [Answer]
+        
+        Include a mix of factual, analytical, and conceptual questions.
+        """,
+        "Error generating Q&A",
+    ),
+    "flashcards": (
+        """
+        Create 15-20 flashcards from this video transcript:
+        
+        {text}
+        
+        Format each flashcard as:
+        FRONT: [Question/Term]
+        BACK: [Answer/Definition]
+        ---
+        
+        Focus on key concepts, definitions, and important facts that would be useful for memorization.
+        """,
+        "Error creating flashcards",
+    ),
+    "insights": (
+        """
+        Analyze this video transcript and extract the key insights and highlights:
+        
+        {text}
+        
+        Provide:
+        1. 🔍 Key Insights (3-5 main insights)
+        2. 💡 Important Revelations
+        3. 📊 Data/Statistics mentioned
+        4. 🎯 Actionable takeaways
+        5. 🔗 Connections to broader topics
+        
+        Use emojis and clear formatting for easy reading.
+        """,
+        "Error extracting insights",
+    ),
+}
+
+# Prompt template and failure message for questions about the transcript.
+# The template also receives the user's question as ``{question}``.
+CHAT_PROMPT = (
+    """
+        Based on this video transcript:
+        
+        {text}
+        
+        User Question: {question}
+        
+        Please provide a detailed answer based on the transcript content. If the question cannot be answered from the transcript, please mention that clearly.
+        """,
+    "Error in chat",
+)
+
+# genai.configure sets the API key for the whole process. Clients hold this
+# lock while they switch the SDK to their own key and take the service client
+# that a request will use, so each request goes out with its own client's key.
+_configure_lock = threading.Lock()
+
+# Worker threads for generate_all, one per insight type
+_GENERATE_ALL_EXECUTOR = ThreadPoolExecutor(max_workers=len(PROMPTS))
 
 
 class GeminiAI:
@@ -24,11 +174,19 @@ class GeminiAI:
         Args:
             api_key (str): The API key for the Google Gemini service.
         """
+        self._api_key = api_key
         if api_key:
-            genai.configure(api_key=api_key)
+            with _configure_lock:
+                genai.configure(api_key=api_key)
             self.model = genai.GenerativeModel("gemini-1.5-flash")
         else:
             self.model = None
+        self._response_cache = OrderedDict()
+        # The client is shared by every session and by background prefetches
+        self._response_cache_lock = threading.Lock()
+        # Transcript digest -> (model, cached content, monotonic expiry time)
+        self._contexts = OrderedDict()
+        self._context_lock = threading.Lock()
 
     def is_configured(self):
         """
@@ -39,190 +197,400 @@ class GeminiAI:
         """
         return self.model is not None
 
-    def generate_summary(self, transcript_text):
+    def prime_transcript(self, transcript_text):
         """
-        Generates a comprehensive summary of the transcript.
+        Uploads the transcript once as cached context for subsequent requests.
+
+        Once primed, requests for this transcript send only the instructions
+        and reference the cached transcript, instead of re-uploading it with
+        every prompt. Transcripts below the service minimum, or any failure to
+        create the cache, leave requests sending the transcript inline. Up to
+        CONTEXT_CACHE_SLOTS transcripts stay primed at once; the least recently
+        used one is deleted from the service to make room.
 
         Args:
             transcript_text (str): The text of the video transcript.
 
         Returns:
-            str: The generated summary, or an error message on failure.
+            bool: True if requests for this transcript use cached context.
         """
-        prompt = f"""
-        Please provide a comprehensive summary of the following video transcript:
-        
-        {transcript_text}
-        
-        Include:
-        1. Main topics discussed
-        2. Key points and insights
-        3. Important conclusions or takeaways
-        
-        Keep the summary clear and well-structured.
+        if not self.model or len(transcript_text) < CONTEXT_CACHE_MIN_CHARS:
+            return False
+
+        digest = self._cache_key(transcript_text)
+        if self._context_model(digest) is not None:
+            return True
+
+        try:
+            from google.generativeai import caching
+
+            # The cache service client is looked up on every call
+            with _configure_lock:
+                genai.configure(api_key=self._api_key)
+                cached_content = caching.CachedContent.create(
+                    model=CONTEXT_CACHE_MODEL,
+                    contents=[transcript_text],
+                    ttl=CONTEXT_CACHE_TTL,
+                )
+            model = genai.GenerativeModel.from_cached_content(cached_content)
+        except Exception:
+            return False
+
+        expires_at = (
+            time.monotonic()
+            + (CONTEXT_CACHE_TTL - CONTEXT_CACHE_EXPIRY_MARGIN).total_seconds()
+        )
+        with self._context_lock:
+            replaced = [self._contexts.pop(digest, None)]
+            self._contexts[digest] = (model, cached_content, expires_at)
+            while len(self._contexts) > CONTEXT_CACHE_SLOTS:
+                replaced.append(self._contexts.popitem(last=False)[1])
+        for entry in replaced:
+            if entry is not None:
+                self._delete_context(entry)
+        return True
+
+    def _context_model(self, digest):
+        """
+        Returns the cached-context model for a transcript, if it is still primed.
+
+        Args:
+            digest (str): The cache key of the transcript text.
+
+        Returns:
+            GenerativeModel: The model bound to the cached transcript, or None
+                             if the transcript is not primed or has expired.
         """
+        with self._context_lock:
+            entry = self._contexts.get(digest)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[2]:
+                # The service drops the cache itself once its TTL has passed
+                del self._contexts[digest]
+                return None
+            self._contexts.move_to_end(digest)
+            return entry[0]
+
+    def _discard_context(self, model):
+        """
+        Forgets and deletes the cached context behind a model that failed.
+
+        Later requests for the transcript then send it inline.
+
+        Args:
+            model (GenerativeModel): The cached-context model that failed.
+        """
+        with self._context_lock:
+            for digest, entry in self._contexts.items():
+                if entry[0] is model:
+                    del self._contexts[digest]
+                    break
+            else:
+                return
+        self._delete_context(entry)
+
+    def _delete_context(self, entry):
+        """
+        Deletes a cached context from the service, ignoring failures.
 
+        Args:
+            entry (tuple): The ``(model, cached content, expiry)`` entry.
+        """
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating summary: {str(e)}"
+            with _configure_lock:
+                genai.configure(api_key=self._api_key)
+                entry[1].delete()
+        except Exception:
+            pass
 
-    def extract_key_quotes(self, transcript_text):
+    def _bind_client(self, model):
         """
-        Extracts key quotes from the transcript.
+        Binds a model to a service client for this instance's API key.
+
+        The SDK takes a model's service client from the process-wide
+        configuration on its first request and keeps it afterwards, so the
+        client is taken here, under this instance's key, before that happens.
 
         Args:
+            model (GenerativeModel): The model about to send a request.
+
+        Returns:
+            GenerativeModel: The same model.
+        """
+        if getattr(model, "_client", None) is None:
+            with _configure_lock:
+                genai.configure(api_key=self._api_key)
+                model._client = genai_client.get_default_generative_client()
+        return model
+
+    def _prepare(self, template, transcript_text, **fields):
+        """
+        Resolves the models and prompts to try, and the response-cache key.
+
+        A primed transcript is tried through its cached context first, with
+        the full inline prompt as the fallback if that request fails.
+
+        Args:
+            template (str): The prompt template, with ``{text}`` for the transcript.
             transcript_text (str): The text of the video transcript.
+            **fields (str): Values for any other placeholders in the template.
 
         Returns:
-            str: The extracted key quotes, or an error message on failure.
+            tuple: The ``(model, prompt)`` attempts, in order, and the cache key.
         """
-        prompt = f"""
-        From the following transcript, extract 5-10 of the most important and impactful quotes:
-        
-        {transcript_text}
-        
-        Format each quote as:
-        "Quote text" - [Approximate timestamp if available]
-        
-        Focus on quotes that:
-        - Capture main ideas
-        - Are memorable or impactful
-        - Represent key insights
+        prompt = template.format(text=transcript_text, **fields)
+        key = self._cache_key(prompt)
+        attempts = ((self.model, prompt),)
+        if self._contexts:
+            context_model = self._context_model(self._cache_key(transcript_text))
+            if context_model is not None:
+                reference_prompt = template.format(
+                    text=CACHED_TRANSCRIPT_REFERENCE, **fields
+                )
+                attempts = ((context_model, reference_prompt),) + attempts
+        return attempts, key
+
+    def generate(self, kind, transcript_text, stream=False):
         """
+        Generates one insight type from the transcript.
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error extracting quotes: {str(e)}"
+        Args:
+            kind (str): The insight type, one of the keys of ``PROMPTS``.
+            transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
-    def create_study_guide(self, transcript_text):
+        Returns:
+            str: The generated content, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        Creates a study guide from the transcript.
+        template, error_message = PROMPTS[kind]
+        attempts, key = self._prepare(template, transcript_text)
+        if stream:
+            return self._stream(attempts, key, error_message)
+        return self._generate(attempts, key, error_message)
+
+    def generate_summary(self, transcript_text, stream=False):
+        """
+        Generates a comprehensive summary of the transcript.
 
         Args:
             transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
         Returns:
-            str: The generated study guide, or an error message on failure.
+            str: The generated summary, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        prompt = f"""
-        Create a comprehensive study guide from this video transcript:
-        
-        {transcript_text}
-        
-        Structure the study guide with:
-        1. Main Topics/Chapters
-        2. Key Concepts and Definitions
-        3. Important Facts and Figures
-        4. Study Questions
-        5. Review Points
-        
-        Make it suitable for learning and revision.
+        return self.generate("summary", transcript_text, stream=stream)
+
+    def extract_key_quotes(self, transcript_text, stream=False):
         """
+        Extracts key quotes from the transcript.
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error creating study guide: {str(e)}"
+        Args:
+            transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
-    def generate_qa(self, transcript_text):
+        Returns:
+            str: The extracted key quotes, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        Generates a Q&A session from the transcript.
+        return self.generate("quotes", transcript_text, stream=stream)
+
+    def create_study_guide(self, transcript_text, stream=False):
+        """
+        Creates a study guide from the transcript.
 
         Args:
             transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
         Returns:
-            str: The generated Q&A, or an error message on failure.
+            str: The generated study guide, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        prompt = f"""
-        Create a Q&A session based on this video transcript:
-        
-        {transcript_text}
-        
-        Generate 10-15 relevant questions and provide detailed answers based on the content.
-        Format as:
-        
-        Q: [Question]
-        A: [Answer]
-        
-        Include a mix of factual, analytical, and conceptual questions.
+        return self.generate("study_guide", transcript_text, stream=stream)
+
+    def generate_qa(self, transcript_text, stream=False):
         """
+        Generates a Q&A session from the transcript.
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating Q&A: {str(e)}"
+        Args:
+            transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
-    def create_flashcards(self, transcript_text):
+        Returns:
+            str: The generated Q&A, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
+        """
+        return self.generate("qa", transcript_text, stream=stream)
+
+    def create_flashcards(self, transcript_text, stream=False):
         """
         Creates flashcards from the transcript.
 
         Args:
             transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
         Returns:
             str: The generated flashcards, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        prompt = f"""
-        Create 15-20 flashcards from this video transcript:
-        
-        {transcript_text}
-        
-        Format each flashcard as:
-        FRONT: [Question/Term]
-        BACK: [Answer/Definition]
-        ---
-        
-        Focus on key concepts, definitions, and important facts that would be useful for memorization.
-        """
-
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error creating flashcards: {str(e)}"
+        return self.generate("flashcards", transcript_text, stream=stream)
 
-    def highlight_insights(self, transcript_text):
+    def highlight_insights(self, transcript_text, stream=False):
         """
         Extracts key insights and highlights from the transcript.
 
         Args:
             transcript_text (str): The text of the video transcript.
+            stream (bool, optional): Whether to stream the response as text
+                                     chunks. Defaults to False.
 
         Returns:
             str: The extracted insights, or an error message on failure.
+                 A generator of text chunks is returned when streaming.
         """
-        prompt = f"""
-        Analyze this video transcript and extract the key insights and highlights:
-        
-        {transcript_text}
-        
-        Provide:
-        1. 🔍 Key Insights (3-5 main insights)
-        2. 💡 Important Revelations
-        3. 📊 Data/Statistics mentioned
-        4. 🎯 Actionable takeaways
-        5. 🔗 Connections to broader topics
-        
-        Use emojis and clear formatting for easy reading.
+        return self.generate("insights", transcript_text, stream=stream)
+
+    def _cache_key(self, prompt):
+        """
+        Returns a compact, stable cache key for a prompt.
         """
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error extracting insights: {str(e)}"
+    def _cache_get(self, key):
+        """
+        Returns the cached response for a key, or None if it is not cached.
+        """
+        with self._response_cache_lock:
+            text = self._response_cache.get(key)
+            if text is not None:
+                self._response_cache.move_to_end(key)
+            return text
+
+    def _cache_put(self, key, text):
+        """
+        Stores a response, evicting the least recently used one when full.
+        """
+        with self._response_cache_lock:
+            self._response_cache[key] = text
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _generate(self, attempts, key, error_message):
+        """
+        Generates content for a prompt, reusing the response for identical prompts.
+
+        A failed cached-context attempt discards that context and moves on to
+        the inline prompt.
+
+        Args:
+            attempts (tuple): The ``(model, prompt)`` pairs to try, in order.
+            key (str): The response-cache key for the request.
+            error_message (str): The prefix of the message returned on failure.
+
+        Returns:
+            str: The generated text, or an error message on failure.
+        """
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        for model, prompt in attempts:
+            try:
+                text = self._bind_client(model).generate_content(prompt).text
+                break
+            except Exception as e:
+                error = e
+                if model is not self.model:
+                    self._discard_context(model)
+        else:
+            return f"{error_message}: {str(error)}"
+        self._cache_put(key, text)
+        return text
+
+    def _stream(self, attempts, key, error_message):
+        """
+        Streams the model response for a prompt as it is generated.
+
+        A response already in the cache is replayed as a single chunk, and a
+        completed stream is added to the cache. A cached-context attempt that
+        fails before yielding anything falls back to the inline prompt.
+
+        Args:
+            attempts (tuple): The ``(model, prompt)`` pairs to try, in order.
+            key (str): The response-cache key for the request.
+            error_message (str): The prefix of the message yielded on failure.
+
+        Yields:
+            str: Chunks of generated text, or an error message on failure.
+        """
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        for model, prompt in attempts:
+            chunks = []
+            try:
+                response = self._bind_client(model).generate_content(
+                    prompt, stream=True
+                )
+                for chunk in response:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+            except Exception as e:
+                if chunks or model is self.model:
+                    yield f"{error_message}: {str(e)}"
+                    return
+                self._discard_context(model)
+                continue
+            self._cache_put(key, "".join(chunks))
+            return
+
+    def generate_all(self, transcript_text):
+        """
+        Generates every insight type for the transcript concurrently.
+
+        All six requests are in flight at once on worker threads, so the total
+        wait is that of the slowest request rather than the sum of all of them.
+        The SDK's async client is avoided, since it stays bound to the first
+        event loop it runs on.
+
+        Args:
+            transcript_text (str): The text of the video transcript.
+
+        Returns:
+            dict: The generated content for each insight type, keyed and
+                  ordered like ``PROMPTS``. Failed items hold an error message.
+        """
+        futures = {
+            kind: _GENERATE_ALL_EXECUTOR.submit(
+                self._generate,
+                *self._prepare(template, transcript_text),
+                error_message,
+            )
+            for kind, (template, error_message) in PROMPTS.items()
+        }
+        return {kind: future.result() for kind, future in futures.items()}
 
     def chat_with_transcript(self, transcript_text, question):
         """
         Allows chatting with the transcript content.
 
+        Answers are cached like generated insights, so asking the same question
+        about the same transcript again does not send another request.
+
         Args:
             transcript_text (str): The text of the video transcript.
             question (str): The user's question about the transcript.
@@ -230,18 +598,6 @@ class GeminiAI:
         Returns:
             str: The AI-generated answer, or an error message on failure.
         """
-        prompt = f"""
-        Based on this video transcript:
-        
-        {transcript_text}
-        
-        User Question: {question}
-        
-        Please provide a detailed answer based on the transcript content. If the question cannot be answered from the transcript, please mention that clearly.
-        """
-
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error in chat: {str(e)}"
+        template, error_message = CHAT_PROMPT
+        attempts, key = self._prepare(template, transcript_text, question=question)
+        return self._generate(attempts, key, error_message)
@@ -4,7 +4,10 @@ the overall layout, user interaction, and coordination between different
 modules such as UI, transcript extraction, and AI processing.
 """
 
+import re
 import streamlit as st
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from .ui import (
     custom_css,
     main_header,
@@ -12,11 +15,163 @@ from .ui import (
     display_transcript,
     display_notes,
     display_chat,
+    get_gemini,
 )
-from .transcript_extractor import YouTubeTranscriptExtractor
-from .gemini_ai import GeminiAI
+from .transcript_extractor import YouTubeTranscriptExtractor, DEFAULT_LANGUAGES
+from .utils import format_timestamp
 from datetime import datetime
 
+# Number of extracted transcripts kept per session for repeated extract clicks
+TRANSCRIPT_CACHE_SIZE = 16
+
+# Insight types requested in the background as soon as a transcript is ready,
+# since they are the ones users usually open first
+PREFETCH_KINDS = ("summary", "insights")
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=len(PREFETCH_KINDS))
+
+# Note ID prefix and display type stored for each insight type
+NOTE_TYPES = {
+    "summary": ("summary", "Summary"),
+    "quotes": ("quotes", "Key Quotes"),
+    "study_guide": ("study", "Study Guide"),
+    "qa": ("qa", "Q&A"),
+    "flashcards": ("flashcards", "Flash Cards"),
+    "insights": ("highlights", "Highlights"),
+}
+
+# Button label and insight type for each column of the actions panel
+ACTION_BUTTONS = (
+    (("📊 Summarize", "summary"), ("💎 Key Quotes", "quotes"), ("❓ Q&A", "qa")),
+    (
+        ("📚 Study Guide", "study_guide"),
+        ("🎯 Flash Cards", "flashcards"),
+        ("✨ Highlights", "insights"),
+    ),
+)
+
+# Non-speech caption tags and spoken fillers that add tokens but no meaning
+# to AI prompts. Timestamps are kept, since some prompts refer to them.
+_FILLER_RE = re.compile(
+    r"\[(?:Music|Applause|Laughter|Inaudible)\][ \t]*|\b(?:u+m+|u+h+)\b,?[ \t]*",
+    re.IGNORECASE,
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _format_transcript(transcript_tuple):
+    """
+    Converts transcript segments into a timestamped text block.
+
+    Args:
+        transcript_tuple (tuple): Immutable ``(start, text)`` pairs, so the
+                                  result can be cached across reruns.
+
+    Returns:
+        str: The transcript with one ``[MM:SS] text`` line per segment.
+    """
+    return "".join(
+        f"[{format_timestamp(start)}] {text}\n" for start, text in transcript_tuple
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _prompt_transcript(transcript_tuple):
+    """
+    Formats the transcript compactly for sending to Gemini.
+
+    Caption tags and filler words are removed, runs of whitespace collapsed,
+    and segments that end up empty or repeat the previous segment's text, as
+    auto-generated captions often do, are dropped.
+
+    Args:
+        transcript_tuple (tuple): Immutable ``(start, text)`` pairs, so the
+                                  result can be cached across reruns.
+
+    Returns:
+        str: The transcript with one ``[MM:SS] text`` line per kept segment.
+    """
+    lines = []
+    previous = None
+    for start, text in transcript_tuple:
+        text = " ".join(_FILLER_RE.sub("", text).split())
+        if text and text != previous:
+            lines.append(f"[{format_timestamp(start)}] {text}\n")
+            previous = text
+    return "".join(lines)
+
+
+def _prefetch_insights(gemini, transcript_text):
+    """
+    Primes the transcript and starts generating the most-used insights in the background.
+
+    The responses land in the client's response cache, so the matching button
+    replays them instead of waiting on a fresh request. Priming runs first on
+    a worker too, so the prefetched requests already use the cached context.
+    A transcript already prefetched with this client is left alone, keeping
+    any requests still in flight for it.
+
+    Args:
+        gemini (GeminiAI): The client to generate with.
+        transcript_text (str): The text of the video transcript.
+    """
+    if st.session_state.prefetch_source == (gemini, transcript_text):
+        return
+    st.session_state.prefetch_source = (gemini, transcript_text)
+
+    primed = _PREFETCH_EXECUTOR.submit(gemini.prime_transcript, transcript_text)
+
+    def generate(kind):
+        primed.result()
+        return gemini.generate(kind, transcript_text)
+
+    st.session_state.prefetch = {
+        kind: _PREFETCH_EXECUTOR.submit(generate, kind) for kind in PREFETCH_KINDS
+    }
+
+
+def _wait_for_prefetch(*kinds):
+    """
+    Blocks until any background requests for the given insight types finish.
+
+    Args:
+        *kinds (str): The insight types about to be requested.
+    """
+    for kind in kinds:
+        future = st.session_state.prefetch.pop(kind, None)
+        if future:
+            future.result()
+
+
+def _note_timestamp():
+    """
+    Returns the current time in the format shown on saved notes.
+
+    Returns:
+        str: The current time as ``YYYY-MM-DD HH:MM:SS``.
+    """
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+def _store_note(kind, content, timestamp=None):
+    """
+    Saves generated content as a new note in ``st.session_state.notes``.
+
+    Args:
+        kind (str): The insight type the content was generated for.
+        content (str): The generated content.
+        timestamp (str, optional): The time to record on the note.
+                                   Defaults to the current time.
+    """
+    prefix, note_type = NOTE_TYPES[kind]
+    st.session_state.note_counter += 1
+    note_id = f"{prefix}_{st.session_state.note_counter}"
+    st.session_state.notes[note_id] = {
+        "id": note_id,
+        "content": content,
+        "type": note_type,
+        "timestamp": timestamp or _note_timestamp(),
+    }
+
 
 def main():
     """
@@ -42,12 +197,22 @@ def main():
         st.session_state.transcript_data = None
     if "transcript_text" not in st.session_state:
         st.session_state.transcript_text = ""
+    if "transcript_text_clean" not in st.session_state:
+        st.session_state.transcript_text_clean = ""
     if "video_info" not in st.session_state:
         st.session_state.video_info = None
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
     if "note_counter" not in st.session_state:
         st.session_state.note_counter = 0
+    if "notes" not in st.session_state:
+        st.session_state.notes = {}
+    if "transcript_cache" not in st.session_state:
+        st.session_state.transcript_cache = OrderedDict()
+    if "prefetch" not in st.session_state:
+        st.session_state.prefetch = {}
+    if "prefetch_source" not in st.session_state:
+        st.session_state.prefetch_source = None
 
     # Display the sidebar and get configuration settings
     use_proxy, proxy_config, gemini_api_key = sidebar()
@@ -72,24 +237,63 @@ def main():
         if extract_btn and video_url:
             with st.spinner("Extracting transcript..."):
                 extractor = YouTubeTranscriptExtractor()
-                transcript, message = extractor.extract_transcript(
-                    video_url, use_proxy=use_proxy, proxy_config=proxy_config
-                )
+                cache_key = (extractor.extract_video_id(video_url), DEFAULT_LANGUAGES)
+
+                if cache_key in st.session_state.transcript_cache:
+                    # Reuse the transcript already extracted for this video
+                    st.session_state.transcript_cache.move_to_end(cache_key)
+                    transcript, video_info = st.session_state.transcript_cache[
+                        cache_key
+                    ]
+                    message = "Loaded transcript from this session"
+                else:
+                    transcript, message = extractor.extract_transcript(
+                        video_url, use_proxy=use_proxy, proxy_config=proxy_config
+                    )
+                    if transcript:
+                        video_info = extractor.video_info
+                        st.session_state.transcript_cache[cache_key] = (
+                            transcript,
+                            video_info,
+                        )
+                        if (
+                            len(st.session_state.transcript_cache)
+                            > TRANSCRIPT_CACHE_SIZE
+                        ):
+                            st.session_state.transcript_cache.popitem(last=False)
 
                 if transcript:
+                    # Convert the transcript to formatted text, for display and
+                    # in compact form for prompts; both are cached per transcript
+                    transcript_tuple = tuple(
+                        (entry.get("start", 0), entry["text"]) for entry in transcript
+                    )
+                    if transcript is not st.session_state.transcript_data:
+                        # Paragraph copies and notes belong to the previous
+                        # transcript's paragraph numbers
+                        for key in (
+                            "recent_copies",
+                            "open_note_inputs",
+                            "transcript_notes",
+                        ):
+                            if key in st.session_state:
+                                st.session_state[key].clear()
                     st.session_state.transcript_data = transcript
-                    st.session_state.video_info = extractor.video_info
-
-                    # Convert transcript to a formatted text string
-                    transcript_text = ""
-                    for entry in transcript:
-                        start_time = entry.get("start", 0)
-                        minutes = int(start_time // 60)
-                        seconds = int(start_time % 60)
-                        timestamp = f"{minutes:02d}:{seconds:02d}"
-                        transcript_text += f"[{timestamp}] {entry['text']}\n"
-
-                    st.session_state.transcript_text = transcript_text
+                    st.session_state.video_info = video_info
+                    st.session_state.transcript_text = _format_transcript(
+                        transcript_tuple
+                    )
+                    st.session_state.transcript_text_clean = _prompt_transcript(
+                        transcript_tuple
+                    )
+
+                    # Upload long transcripts once as cached Gemini context,
+                    # and start on the insights users usually open first
+                    if gemini_api_key:
+                        _prefetch_insights(
+                            get_gemini(gemini_api_key),
+                            st.session_state.transcript_text_clean,
+                        )
                     st.markdown(
                         f'<div class="success-box">✅ {message}</div>',
                         unsafe_allow_html=True,
@@ -119,94 +323,39 @@ def main():
     with col2:
         st.subheader("🧠 Insights & Actions")
         if st.session_state.transcript_text and gemini_api_key:
-            gemini = GeminiAI(gemini_api_key)
+            gemini = get_gemini(gemini_api_key)
 
             # Action buttons for generating AI content
-            col_a, col_b = st.columns(2)
+            for column, buttons in zip(st.columns(2), ACTION_BUTTONS):
+                with column:
+                    for label, kind in buttons:
+                        if st.button(label, use_container_width=True):
+                            _wait_for_prefetch(kind)
+                            # Stream into a placeholder and clear it once the note
+                            # is saved; the notes section further down this run
+                            # then shows it, without another full rerun
+                            stream_placeholder = st.empty()
+                            with stream_placeholder:
+                                content = st.write_stream(
+                                    gemini.generate(
+                                        kind,
+                                        st.session_state.transcript_text_clean,
+                                        stream=True,
+                                    )
+                                )
+                            _store_note(kind, content)
+                            stream_placeholder.empty()
 
-            with col_a:
-                if st.button("📊 Summarize", use_container_width=True):
-                    with st.spinner("Generating summary..."):
-                        summary = gemini.generate_summary(
-                            st.session_state.transcript_text
-                        )
-                        st.session_state.note_counter += 1
-                        note_id = f"summary_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": summary,
-                            "type": "Summary",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
-
-                if st.button("💎 Key Quotes", use_container_width=True):
-                    with st.spinner("Extracting quotes..."):
-                        quotes = gemini.extract_key_quotes(
-                            st.session_state.transcript_text
-                        )
-                        st.session_state.note_counter += 1
-                        note_id = f"quotes_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": quotes,
-                            "type": "Key Quotes",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
-
-                if st.button("❓ Q&A", use_container_width=True):
-                    with st.spinner("Generating Q&A..."):
-                        qa = gemini.generate_qa(st.session_state.transcript_text)
-                        st.session_state.note_counter += 1
-                        note_id = f"qa_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": qa,
-                            "type": "Q&A",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
-
-            with col_b:
-                if st.button("📚 Study Guide", use_container_width=True):
-                    with st.spinner("Creating study guide..."):
-                        guide = gemini.create_study_guide(
-                            st.session_state.transcript_text
-                        )
-                        st.session_state.note_counter += 1
-                        note_id = f"study_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": guide,
-                            "type": "Study Guide",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
-
-                if st.button("🎯 Flash Cards", use_container_width=True):
-                    with st.spinner("Creating flashcards..."):
-                        cards = gemini.create_flashcards(
-                            st.session_state.transcript_text
-                        )
-                        st.session_state.note_counter += 1
-                        note_id = f"flashcards_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": cards,
-                            "type": "Flash Cards",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
-
-                if st.button("✨ Highlights", use_container_width=True):
-                    with st.spinner("Extracting insights..."):
-                        insights = gemini.highlight_insights(
-                            st.session_state.transcript_text
-                        )
-                        st.session_state.note_counter += 1
-                        note_id = f"highlights_{st.session_state.note_counter}"
-                        st.session_state[f"note_{note_id}"] = {
-                            "content": insights,
-                            "type": "Highlights",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        }
-                        st.rerun()
+            # Generate every insight type in one go, with all requests in flight at once
+            if st.button("🚀 Generate All", type="primary", use_container_width=True):
+                with st.spinner("Generating all insights..."):
+                    _wait_for_prefetch(*PREFETCH_KINDS)
+                    results = gemini.generate_all(
+                        st.session_state.transcript_text_clean
+                    )
+                    timestamp = _note_timestamp()
+                    for kind, content in results.items():
+                        _store_note(kind, content, timestamp)
 
         elif st.session_state.transcript_text:
             st.info("🔑 Enter Gemini API key to enable AI features")
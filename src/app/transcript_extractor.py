@@ -6,27 +6,454 @@ proxy support, and handling of different transcript sources.
 """
 
 import streamlit as st
+import asyncio
+import importlib.util
 import re
 import json
 import tempfile
 import os
+import random
+import threading
+import time
+import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from urllib.parse import parse_qs, urlsplit
 
-# Check for the availability of the youtube_transcript_api library
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
+# Network failures worth retrying. Missing or disabled transcripts and IP
+# blocks are raised as other errors and fail immediately.
+_TRANSIENT_ERRORS = (requests.RequestException,)
 
-    TRANSCRIPT_API_AVAILABLE = True
-except ImportError:
-    TRANSCRIPT_API_AVAILABLE = False
+# HTTP statuses worth retrying; any other HTTP error response is permanent
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
-# Check for the availability of the yt-dlp library
-try:
-    import yt_dlp
+# The status code at the start of a requests HTTPError message
+_HTTP_STATUS_RE = re.compile(r"\d{3}\b")
 
-    YT_DLP_AVAILABLE = True
-except ImportError:
-    YT_DLP_AVAILABLE = False
+# Both transcript sources are slow to import (yt-dlp loads every extractor
+# module up front), so only their availability is checked here. They are
+# imported on first use by _import_transcript_api and _import_yt_dlp.
+TRANSCRIPT_API_AVAILABLE = (
+    importlib.util.find_spec("youtube_transcript_api") is not None
+)
+YT_DLP_AVAILABLE = importlib.util.find_spec("yt_dlp") is not None
+YouTubeTranscriptApi = None
+yt_dlp = None
+_transcript_api = None
+
+
+def _import_transcript_api():
+    """
+    Imports the youtube_transcript_api client on first use.
+
+    Returns:
+        type: The ``YouTubeTranscriptApi`` class.
+    """
+    global YouTubeTranscriptApi, _TRANSIENT_ERRORS
+    if YouTubeTranscriptApi is None:
+        import youtube_transcript_api
+
+        if hasattr(youtube_transcript_api, "YouTubeRequestFailed"):
+            _TRANSIENT_ERRORS += (youtube_transcript_api.YouTubeRequestFailed,)
+        YouTubeTranscriptApi = youtube_transcript_api.YouTubeTranscriptApi
+    return YouTubeTranscriptApi
+
+
+def _transcript_api_client():
+    """
+    Returns the shared YouTube Transcript API client, creating it on first use.
+
+    The client sends its requests through _HTTP_SESSION, so consecutive
+    fetches reuse open connections instead of a new session per video.
+
+    Returns:
+        YouTubeTranscriptApi: The shared client.
+    """
+    global _transcript_api
+    if _transcript_api is None:
+        _transcript_api = _import_transcript_api()(http_client=_HTTP_SESSION)
+    return _transcript_api
+
+
+def _import_yt_dlp():
+    """
+    Imports yt-dlp on first use.
+
+    Returns:
+        module: The ``yt_dlp`` module.
+    """
+    global yt_dlp
+    if yt_dlp is None:
+        import yt_dlp as module
+
+        yt_dlp = module
+    return yt_dlp
+
+
+# Caption languages to try, in order of preference
+DEFAULT_LANGUAGES = ("en", "en-US", "en-GB")
+
+# The 11-character video ID follows either "v=" or a path separator, which
+# covers watch, youtu.be, embed and shorts URLs in a single scan
+_VIDEO_ID_RE = re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})")
+
+# Well-formed YouTube URLs are split into parts and read directly, and only
+# other shapes fall back to scanning with _VIDEO_ID_RE
+_VIDEO_ID_FORMAT = re.compile(r"[0-9A-Za-z_-]{11}")
+_VIDEO_ID_PATH_PREFIXES = ("/embed/", "/shorts/", "/live/", "/v/")
+
+# Inline markup in caption text, such as <c> voice spans and <00:00:01.000> cue times
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Seconds the YouTube Transcript API gets on its own before yt-dlp is started
+# alongside it. Most API calls (and every cache hit) finish well inside this,
+# so yt-dlp only runs when the API is slow or failing.
+FALLBACK_HEDGE_DELAY = 2.0
+
+# Worker threads for each transcript source. The attempt that loses a race is
+# left to finish in the background, so each source has its own workers and a
+# stuck attempt only holds up later attempts at that same source.
+TRANSCRIPT_SOURCE_WORKERS = 8
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=TRANSCRIPT_SOURCE_WORKERS)
+_YTDLP_EXECUTOR = ThreadPoolExecutor(max_workers=TRANSCRIPT_SOURCE_WORKERS)
+
+# Videos extracted at once by extract_transcripts. Each has at most one
+# attempt per source in flight, so a full batch fits the source workers.
+BATCH_EXTRACTION_CONCURRENCY = TRANSCRIPT_SOURCE_WORKERS
+
+# Shared session for subtitle downloads. It keeps connections alive between
+# format attempts and, unlike urllib, advertises and decodes compressed
+# responses (gzip/deflate, plus brotli when installed), so caption payloads
+# are several times smaller on the wire
+_HTTP_SESSION = requests.Session()
+
+# Connections kept per host in the shared session. Transcript API fetches
+# and subtitle downloads run on the source workers, which each hold at most
+# one connection at a time, so the pool keeps one per worker of both
+# sources alive instead of closing those over the default limit of 10
+HTTP_POOL_SIZE = 2 * TRANSCRIPT_SOURCE_WORKERS
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+
+# Read buffer size in bytes for subtitle files written by yt-dlp
+SUBTITLE_READ_BUFFER = 1 << 16
+
+# Distinct cue timestamps remembered by _parse_fixed_timestamp
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Attempts per transcript fetch, and the base delay in seconds between them
+TRANSCRIPT_RETRIES = 3
+TRANSCRIPT_RETRY_DELAY = 0.2
+
+
+# Options shared by every yt-dlp client. Subtitle files are written under a
+# per-call "paths" home directory, so a client can serve any extraction.
+_YTDLP_OPTIONS = {
+    "writesubtitles": True,
+    "writeautomaticsub": True,
+    "skip_download": True,
+    "quiet": True,
+    "no_warnings": True,
+    "subtitleslangs": list(DEFAULT_LANGUAGES),
+    "subtitlesformat": "vtt/srt/best",
+    "outtmpl": "%(title)s.%(ext)s",
+}
+
+# Idle yt-dlp clients by proxy. A client handles one extraction at a time,
+# so concurrent fallbacks each take their own, and up to YTDLP_POOL_SIZE per
+# proxy are kept for reuse afterwards.
+YTDLP_POOL_SIZE = 4
+_YTDLP_CLIENTS = {}
+_YTDLP_CLIENTS_LOCK = threading.Lock()
+
+
+@contextmanager
+def _ytdlp_client(proxy=None):
+    """
+    Lends out an idle yt-dlp client for a proxy, creating one if none is free.
+
+    Reusing a client keeps its extractors, cookie jar and open connections
+    between extractions instead of rebuilding them for every fallback, while
+    a slow extraction only holds up its own client.
+
+    Args:
+        proxy (str, optional): The proxy URL to route through. Defaults to None.
+
+    Yields:
+        YoutubeDL: A client for this caller's exclusive use until it exits.
+    """
+    with _YTDLP_CLIENTS_LOCK:
+        idle = _YTDLP_CLIENTS.setdefault(proxy, [])
+        client = idle.pop() if idle else None
+    if client is None:
+        options = dict(_YTDLP_OPTIONS)
+        if proxy:
+            options["proxy"] = proxy
+        client = _import_yt_dlp().YoutubeDL(options)
+
+    try:
+        yield client
+    finally:
+        with _YTDLP_CLIENTS_LOCK:
+            if len(idle) < YTDLP_POOL_SIZE:
+                idle.append(client)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_fixed_timestamp(timestamp_str, separator):
+    """
+    Parses a fixed-width ``HH:MM:SS.mmm`` timestamp by slicing its fields.
+
+    This is the layout almost every cue uses, so the digit fields are joined
+    and converted with a single ``int()`` call, skipping the split and float
+    round trips of the general parsers. Results are memoized, since a cue
+    usually starts at the timestamp where the previous one ended.
+
+    Args:
+        timestamp_str (str): The stripped timestamp string to parse.
+        separator (str): The milliseconds separator, "." for VTT or "," for SRT.
+
+    Returns:
+        float: The timestamp in seconds, or None if the string is not in the
+               fixed-width layout.
+    """
+    if (
+        len(timestamp_str) != 12
+        or timestamp_str[8] != separator
+        or timestamp_str[2] != ":"
+        or timestamp_str[5] != ":"
+    ):
+        return None
+
+    # HHMMSSmmm as one number
+    digits = (
+        timestamp_str[0:2] + timestamp_str[3:5] + timestamp_str[6:8] + timestamp_str[9:]
+    )
+    if not digits.isdecimal():
+        return None
+    value = int(digits)
+    return (
+        value // 10_000_000 * 3600
+        + value // 100_000 % 100 * 60
+        + value // 1000 % 100
+        + value % 1000 / 1000
+    )
+
+
+def _show_messages(messages):
+    """
+    Shows the messages collected by transcript attempts in the app.
+
+    Args:
+        messages (list): ``(level, text)`` pairs, where level names the
+                         Streamlit call to use, "error" or "warning".
+    """
+    for level, text in messages:
+        getattr(st, level)(text)
+
+
+def _iter_response_lines(response):
+    """
+    Yields the lines of a streamed HTTP response as its body arrives.
+
+    Chunks are decoded incrementally, and a line split across two chunks is
+    carried over rather than yielded in halves. Unlike ``iter_lines``, this
+    never turns a CRLF split across a chunk boundary into an extra blank line,
+    which would end a caption cue early.
+
+    Args:
+        response (requests.Response): A response opened with ``stream=True``.
+
+    Yields:
+        str: Each line, without its "\n" terminator.
+    """
+    response.encoding = "utf-8"
+    pending = ""
+    for chunk in response.iter_content(
+        chunk_size=SUBTITLE_READ_BUFFER, decode_unicode=True
+    ):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _http_status(error):
+    """
+    Returns the HTTP status code behind a request failure, if it has one.
+
+    YouTubeRequestFailed wraps the HTTP error it was raised from and keeps
+    only its text, so the status is read from the chained error when there
+    is one, and otherwise from the code the text starts with, as in
+    "404 Client Error: Not Found for url: ...".
+
+    Args:
+        error (Exception): The exception raised by the request.
+
+    Returns:
+        int: The HTTP status code, or None if the failure had no response.
+    """
+    for exc in (error, error.__cause__, error.__context__):
+        response = getattr(exc, "response", None)
+        if response is not None:
+            return response.status_code
+    reason = getattr(error, "reason", None)
+    if isinstance(reason, str):
+        match = _HTTP_STATUS_RE.match(reason)
+        if match:
+            return int(match.group())
+    return None
+
+
+def _retry_transient(func, *args, **kwargs):
+    """
+    Calls a function, retrying transient network failures.
+
+    Retries back off exponentially with a little random jitter, so a brief
+    rate limit or dropped connection resolves within the same click. HTTP
+    errors are only retried for rate limits and server errors.
+
+    Args:
+        func (callable): The function to call.
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        The return value of ``func``.
+    """
+    for attempt in range(TRANSCRIPT_RETRIES):
+        try:
+            return func(*args, **kwargs)
+        except _TRANSIENT_ERRORS as e:
+            status_code = _http_status(e)
+            if attempt == TRANSCRIPT_RETRIES - 1 or (
+                status_code is not None and status_code not in _RETRYABLE_STATUS_CODES
+            ):
+                raise
+            time.sleep(
+                TRANSCRIPT_RETRY_DELAY * 2**attempt
+                + random.uniform(0, TRANSCRIPT_RETRY_DELAY / 2)
+            )
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _fetch_transcript_cached(video_id, languages, _proxies=None):
+    """
+    Fetches a transcript from the YouTube Transcript API, memoized for an hour.
+
+    Repeated extractions of the same video (and language preference) are served
+    from the Streamlit data cache instead of going back to YouTube, across
+    reruns and sessions. Failures raise and are therefore never cached.
+
+    Args:
+        video_id (str): The ID of the YouTube video.
+        languages (tuple): Preferred language codes, in order. Must be a tuple
+                           so it can be used as a cache key.
+        _proxies (dict, optional): A dictionary of proxy settings. Defaults to None.
+                                   Left out of the cache key (leading underscore),
+                                   since the route does not change the transcript.
+
+    Returns:
+        list: A list of transcript segments.
+    """
+    api = _import_transcript_api()
+    if hasattr(api, "get_transcript"):
+        # Releases before 1.0 only offer class methods, with a new session per call
+        if _proxies:
+            return _retry_transient(
+                api.get_transcript,
+                video_id,
+                languages=list(languages),
+                proxies=_proxies,
+            )
+        return _retry_transient(api.get_transcript, video_id, languages=list(languages))
+
+    if _proxies:
+        # Proxies are set on the client's session, so proxied fetches get a
+        # client of their own rather than the shared one
+        from youtube_transcript_api.proxies import GenericProxyConfig
+
+        client = api(
+            proxy_config=GenericProxyConfig(
+                http_url=_proxies["http"], https_url=_proxies["https"]
+            )
+        )
+    else:
+        client = _transcript_api_client()
+    fetched = _retry_transient(client.fetch, video_id, languages=list(languages))
+    return fetched.to_raw_data()
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _fetch_ytdlp_cached(video_id, _extractor, _proxy=None):
+    """
+    Extracts a transcript with yt-dlp, memoized for an hour.
+
+    Like _fetch_transcript_cached, only successful extractions are cached, so
+    a video without usable subtitles is tried again on the next request. The
+    extraction shows nothing in the app, so cache hits replay no messages.
+
+    Args:
+        video_id (str): The ID of the YouTube video.
+        _extractor (YouTubeTranscriptExtractor): The extractor that runs yt-dlp
+                                                 and parses the subtitles. Left
+                                                 out of the cache key.
+        _proxy (str, optional): The proxy URL to route through. Defaults to None.
+                                Left out of the cache key, since the route does
+                                not change the transcript.
+
+    Returns:
+        tuple: The list of transcript segments and the video info dictionary.
+
+    Raises:
+        LookupError: If the video has no usable subtitles.
+    """
+    return _extractor._extract_ytdlp(video_id, _proxy)
+
+
+async def fetch_transcript_async(video_id, languages=DEFAULT_LANGUAGES):
+    """
+    Fetches a transcript from the YouTube Transcript API without blocking the event loop.
+
+    The blocking fetch runs on the API source workers, so the calling event
+    loop stays free to serve other requests while YouTube answers.
+
+    Args:
+        video_id (str): The ID of the YouTube video.
+        languages (tuple, optional): Preferred language codes, in order.
+                                     Defaults to DEFAULT_LANGUAGES.
+
+    Returns:
+        list: A list of transcript segments.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _API_EXECUTOR, _fetch_transcript_cached, video_id, tuple(languages)
+    )
+
+
+async def fetch_transcripts_async(video_ids, languages=DEFAULT_LANGUAGES):
+    """
+    Fetches transcripts for several videos concurrently.
+
+    Args:
+        video_ids (list): The IDs of the YouTube videos.
+        languages (tuple, optional): Preferred language codes, in order.
+                                     Defaults to DEFAULT_LANGUAGES.
+
+    Returns:
+        list: One entry per video ID, in the same order. Each entry is either a
+              list of transcript segments or the exception raised for that video.
+    """
+    return await asyncio.gather(
+        *(fetch_transcript_async(video_id, languages) for video_id in video_ids),
+        return_exceptions=True,
+    )
 
 
 class YouTubeTranscriptExtractor:
@@ -54,182 +481,200 @@ class YouTubeTranscriptExtractor:
         Returns:
             str: The extracted video ID, or None if not found.
         """
-        patterns = [
-            r"(?:v=|\/)([0-9A-Za-z_-]{11}).*",
-            r"(?:embed\/)([0-9A-Za-z_-]{11})",
-            r"(?:watch\?v=)([0-9A-Za-z_-]{11})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
-
-    def get_transcript_with_proxy(self, video_id, proxies=None):
+        url = url.strip()
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            parts = None
+
+        candidate = None
+        if parts and parts.hostname:
+            host = parts.hostname
+            if host == "youtu.be":
+                candidate = parts.path[1:]
+            elif host == "youtube.com" or host.endswith(".youtube.com"):
+                if parts.path == "/watch":
+                    candidate = parse_qs(parts.query).get("v", [None])[0]
+                elif parts.path.startswith(_VIDEO_ID_PATH_PREFIXES):
+                    candidate = parts.path.split("/", 3)[2]
+        if candidate and _VIDEO_ID_FORMAT.fullmatch(candidate):
+            return candidate
+
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
+
+    def get_transcript_with_proxy(self, video_id, proxies=None, languages=None):
         """
         Retrieves a transcript using the YouTube Transcript API with proxy support.
 
         Args:
             video_id (str): The ID of the YouTube video.
             proxies (dict, optional): A dictionary of proxy settings. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
 
         Returns:
             list: A list of transcript segments, or None on failure.
         """
+        languages = tuple(languages or DEFAULT_LANGUAGES)
         try:
-            if proxies:
-                transcript_list = YouTubeTranscriptApi.get_transcript(
-                    video_id, proxies=proxies
-                )
-            else:
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
+            transcript_list = _fetch_transcript_cached(video_id, languages, proxies)
             return transcript_list
         except Exception as e:
             st.error(f"YouTube Transcript API failed: {str(e)}")
             return None
 
-    def get_transcript_youtube_api(self, video_id, use_proxy=False, proxy_config=None):
+    def get_transcript_youtube_api(
+        self, video_id, use_proxy=False, proxy_config=None, languages=None
+    ):
         """
         Retrieves a transcript using the YouTube Transcript API, with an option for a proxy.
 
+        The whole language preference list is handed to the API in a single call,
+        which picks the first available match without extra round trips.
+
         Args:
             video_id (str): The ID of the YouTube video.
             use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
             proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
 
         Returns:
             list: A list of transcript segments, or None on failure.
         """
+        transcript, _, messages = self._try_youtube_api(
+            video_id, use_proxy, proxy_config, languages
+        )
+        _show_messages(messages)
+        return transcript
+
+    def _try_youtube_api(
+        self, video_id, use_proxy=False, proxy_config=None, languages=None
+    ):
+        """
+        Fetches a transcript from the YouTube Transcript API without showing anything.
+
+        Safe to run on a worker thread: problems are returned as messages for
+        the caller to show, and the extractor is left untouched.
+
+        Args:
+            video_id (str): The ID of the YouTube video.
+            use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
+            proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
+
+        Returns:
+            tuple: The list of transcript segments (None on failure), None in
+                   place of video info, and a list of ``(level, text)`` messages.
+        """
+        languages = tuple(languages or DEFAULT_LANGUAGES)
         try:
             if use_proxy and proxy_config:
                 proxies = {"http": proxy_config, "https": proxy_config}
-                transcript_list = self.get_transcript_with_proxy(video_id, proxies)
+                transcript_list = _fetch_transcript_cached(video_id, languages, proxies)
             else:
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-            return transcript_list
+                transcript_list = _fetch_transcript_cached(video_id, languages)
+            return transcript_list, None, []
         except Exception as e:
             error_message = str(e)
             if "blocked" in error_message.lower() or "ip" in error_message.lower():
-                st.error(
+                message = (
                     "🚫 Your IP has been blocked by YouTube. Try using a proxy or VPN."
                 )
             else:
-                st.error(f"YouTube Transcript API failed: {error_message}")
-            return None
+                message = f"YouTube Transcript API failed: {error_message}"
+            return None, None, [("error", message)]
 
     def _parse_vtt_content(self, vtt_content):
         """
         Parses VTT (WebVTT) subtitle content and converts it to transcript format.
 
         Args:
-            vtt_content (str): The raw VTT content as a string.
+            vtt_content (str or iterable): The raw VTT content, either as a string
+                                           or as an iterable of lines such as an
+                                           open file.
 
         Returns:
             list: A list of transcript segments with text, start time, and duration.
         """
-        transcript = []
-        lines = vtt_content.split("\n")
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines and WEBVTT headers
-            if (
-                not line
-                or line.startswith("WEBVTT")
-                or line.startswith("Kind:")
-                or line.startswith("Language:")
-            ):
-                i += 1
-                continue
+        return self._parse_subtitle_content(vtt_content, ".")
 
-            # Look for timestamp lines (format: 00:00:00.000 --> 00:00:00.000)
-            if "-->" in line:
-                try:
-                    # Parse timestamp
-                    timestamp_parts = line.split(" --> ")
-                    if len(timestamp_parts) == 2:
-                        start_time = self._parse_timestamp(timestamp_parts[0])
-                        end_time = self._parse_timestamp(timestamp_parts[1])
-                        duration = end_time - start_time
-
-                        # Get the text content (next non-empty lines)
-                        text_lines = []
-                        i += 1
-                        while i < len(lines) and lines[i].strip():
-                            text_line = lines[i].strip()
-                            # Remove HTML tags and formatting
-                            text_line = re.sub(r"<[^>]+>", "", text_line)
-                            if text_line:
-                                text_lines.append(text_line)
-                            i += 1
-
-                        if text_lines:
-                            text = " ".join(text_lines)
-                            transcript.append(
-                                {
-                                    "text": text,
-                                    "start": start_time,
-                                    "duration": duration,
-                                }
-                            )
-                except Exception as e:
-                    # Skip malformed timestamp lines
-                    pass
+    def _parse_srt_content(self, srt_content):
+        """
+        Parses SRT subtitle content and converts it to transcript format.
 
-            i += 1
+        Args:
+            srt_content (str or iterable): The raw SRT content, either as a string
+                                           or as an iterable of lines such as an
+                                           open file.
 
-        return transcript
+        Returns:
+            list: A list of transcript segments with text, start time, and duration.
+        """
+        return self._parse_subtitle_content(srt_content, ",")
 
-    def _parse_srt_content(self, srt_content):
+    def _parse_subtitle_content(self, content, separator):
         """
-        Parses SRT subtitle content and converts it to transcript format.
+        Parses VTT or SRT subtitle content in a single forward pass.
+
+        Both formats are a series of cues, each a timestamp line followed by text
+        lines up to a blank line. Outside a cue, everything but a timestamp line
+        (the WEBVTT header, NOTE blocks, cue identifiers and SRT sequence numbers)
+        is skipped, so the two formats differ only in the milliseconds separator.
 
         Args:
-            srt_content (str): The raw SRT content as a string.
+            content (str or iterable): The raw subtitle content, either as a string
+                                       or as an iterable of lines such as an open
+                                       file.
+            separator (str): The milliseconds separator in timestamps, "." for VTT
+                             or "," for SRT.
 
         Returns:
             list: A list of transcript segments with text, start time, and duration.
         """
         transcript = []
-        blocks = srt_content.strip().split("\n\n")
 
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if len(lines) >= 3:
-                try:
-                    # Skip sequence number (first line)
-                    # Parse timestamp (second line)
-                    timestamp_line = lines[1]
-                    if "-->" in timestamp_line:
-                        timestamp_parts = timestamp_line.split(" --> ")
-                        if len(timestamp_parts) == 2:
-                            start_time = self._parse_srt_timestamp(timestamp_parts[0])
-                            end_time = self._parse_srt_timestamp(timestamp_parts[1])
-                            duration = end_time - start_time
-
-                            # Get text content (remaining lines)
-                            text_lines = lines[2:]
-                            text = " ".join(
-                                line.strip() for line in text_lines if line.strip()
-                            )
-                            # Remove HTML tags
-                            text = re.sub(r"<[^>]+>", "", text)
-
-                            if text:
-                                transcript.append(
-                                    {
-                                        "text": text,
-                                        "start": start_time,
-                                        "duration": duration,
-                                    }
-                                )
-                except Exception as e:
-                    # Skip malformed blocks
+        # Timing and text lines of the cue being read, or None between cues
+        cue = None
+
+        # The trailing "" closes a final cue that runs to the end of the file
+        lines = content.splitlines() if isinstance(content, str) else content
+        for line in chain(lines, ("",)):
+            line = line.strip()
+
+            if cue is not None:
+                if line:
+                    # Remove HTML tags and formatting, skipping the regex for
+                    # the plain lines that make up most captions
+                    if "<" in line:
+                        line = _HTML_TAG_RE.sub("", line)
+                    if line:
+                        cue[2].append(line)
                     continue
 
+                start_time, duration, text_lines = cue
+                if text_lines:
+                    transcript.append(
+                        {
+                            "text": " ".join(text_lines),
+                            "start": start_time,
+                            "duration": duration,
+                        }
+                    )
+                cue = None
+                continue
+
+            # Look for timestamp lines (format: 00:00:00.000 --> 00:00:00.000),
+            # which VTT may follow with cue settings such as "align:start"
+            start_str, arrow, end_str = line.partition(" --> ")
+            if arrow and " --> " not in end_str:
+                end_str, _, _ = end_str.partition(" ")
+                start_time = self._parse_cue_timestamp(start_str, separator)
+                end_time = self._parse_cue_timestamp(end_str, separator)
+                cue = (start_time, end_time - start_time, [])
+
         return transcript
 
     def _parse_timestamp(self, timestamp_str):
@@ -242,32 +687,7 @@ class YouTubeTranscriptExtractor:
         Returns:
             float: The timestamp in seconds.
         """
-        try:
-            # Remove any extra whitespace
-            timestamp_str = timestamp_str.strip()
-
-            # Handle different timestamp formats
-            if "." in timestamp_str:
-                time_part, ms_part = timestamp_str.rsplit(".", 1)
-                milliseconds = float("0." + ms_part)
-            else:
-                time_part = timestamp_str
-                milliseconds = 0.0
-
-            # Parse HH:MM:SS
-            time_components = time_part.split(":")
-            if len(time_components) == 3:
-                hours, minutes, seconds = map(int, time_components)
-                total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds
-                return total_seconds
-            elif len(time_components) == 2:
-                minutes, seconds = map(int, time_components)
-                total_seconds = minutes * 60 + seconds + milliseconds
-                return total_seconds
-        except Exception:
-            return 0.0
-
-        return 0.0
+        return self._parse_cue_timestamp(timestamp_str, ".")
 
     def _parse_srt_timestamp(self, timestamp_str):
         """
@@ -279,32 +699,52 @@ class YouTubeTranscriptExtractor:
         Returns:
             float: The timestamp in seconds.
         """
-        try:
-            timestamp_str = timestamp_str.strip()
+        return self._parse_cue_timestamp(timestamp_str, ",")
 
-            # SRT uses comma for milliseconds
-            if "," in timestamp_str:
-                time_part, ms_part = timestamp_str.rsplit(",", 1)
-                milliseconds = float("0." + ms_part)
-            else:
-                time_part = timestamp_str
-                milliseconds = 0.0
-
-            # Parse HH:MM:SS
-            time_components = time_part.split(":")
-            if len(time_components) == 3:
-                hours, minutes, seconds = map(int, time_components)
-                total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds
-                return total_seconds
-        except Exception:
+    def _parse_cue_timestamp(self, timestamp_str, separator):
+        """
+        Parses a cue timestamp string (HH:MM:SS.mmm or MM:SS.mmm) to seconds.
+
+        Args:
+            timestamp_str (str): The timestamp string to parse.
+            separator (str): The milliseconds separator, "." for VTT or "," for SRT.
+
+        Returns:
+            float: The timestamp in seconds, or 0.0 if it cannot be parsed.
+        """
+        # Remove any extra whitespace
+        timestamp_str = timestamp_str.strip()
+
+        seconds = _parse_fixed_timestamp(timestamp_str, separator)
+        if seconds is not None:
+            return seconds
+
+        # Split off the optional milliseconds, then HH:MM:SS or MM:SS
+        time_part, has_separator, ms_part = timestamp_str.rpartition(separator)
+        if not has_separator:
+            time_part, ms_part = timestamp_str, ""
+        time_components = time_part.split(":")
+        if (
+            len(time_components) not in (2, 3)
+            or not (time_part.replace(":", "") + ms_part).isdecimal()
+            or "" in time_components
+        ):
             return 0.0
 
-        return 0.0
+        milliseconds = float("0." + ms_part) if ms_part else 0.0
+        if len(time_components) == 3:
+            hours, minutes, seconds = map(int, time_components)
+            return hours * 3600 + minutes * 60 + seconds + milliseconds
+        minutes, seconds = map(int, time_components)
+        return minutes * 60 + seconds + milliseconds
 
     def get_transcript_ytdlp(self, video_id, use_proxy=False, proxy_config=None):
         """
         Retrieves a transcript using yt-dlp as a fallback, with proxy support.
 
+        Results are memoized for an hour, so extracting the same video again
+        skips the yt-dlp info extraction and subtitle download.
+
         Args:
             video_id (str): The ID of the YouTube video.
             use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
@@ -313,104 +753,146 @@ class YouTubeTranscriptExtractor:
         Returns:
             list: A list of transcript segments, or None on failure.
         """
+        transcript, video_info, messages = self._try_ytdlp(
+            video_id, use_proxy, proxy_config
+        )
+        _show_messages(messages)
+        if transcript:
+            self.video_info = {
+                **video_info,
+                "extracted_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        return transcript
+
+    def _try_ytdlp(self, video_id, use_proxy=False, proxy_config=None):
+        """
+        Fetches a transcript with yt-dlp without showing anything.
+
+        Safe to run on a worker thread: problems are returned as messages for
+        the caller to show, and the extractor is left untouched.
+
+        Args:
+            video_id (str): The ID of the YouTube video.
+            use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
+            proxy_config (str, optional): The proxy configuration string. Defaults to None.
+
+        Returns:
+            tuple: The list of transcript segments (None on failure), the video
+                   info dictionary (None on failure), and a list of
+                   ``(level, text)`` messages.
+        """
+        proxy = proxy_config if use_proxy and proxy_config else None
         try:
-            url = f"https://www.youtube.com/watch?v={video_id}"
-
-            # Create a temporary directory for subtitle files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                ydl_opts = {
-                    "writesubtitles": True,
-                    "writeautomaticsub": True,
-                    "skip_download": True,
-                    "quiet": True,
-                    "no_warnings": True,
-                    "subtitleslangs": ["en", "en-US", "en-GB"],
-                    "subtitlesformat": "vtt/srt/best",
-                    "outtmpl": os.path.join(temp_dir, "%(title)s.%(ext)s"),
-                }
-
-                if use_proxy and proxy_config:
-                    ydl_opts["proxy"] = proxy_config
-
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    # Extract info without downloading video
-                    info = ydl.extract_info(url, download=False)
-
-                    # Store video info
-                    self.video_info = {
-                        "video_id": video_id,
-                        "url": url,
-                        "title": info.get("title", "Unknown Title"),
-                        "duration": info.get("duration", 0),
-                        "extracted_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    }
-
-                    # Try to download subtitles
-                    ydl.download([url])
-
-                    # Look for subtitle files in the temp directory
-                    subtitle_files = []
-                    for file in os.listdir(temp_dir):
-                        if file.endswith((".vtt", ".srt")):
-                            subtitle_files.append(os.path.join(temp_dir, file))
-
-                    # Process the first available subtitle file
-                    for subtitle_file in subtitle_files:
-                        try:
-                            with open(subtitle_file, "r", encoding="utf-8") as f:
-                                content = f.read()
-
-                            if subtitle_file.endswith(".vtt"):
-                                transcript = self._parse_vtt_content(content)
-                            elif subtitle_file.endswith(".srt"):
-                                transcript = self._parse_srt_content(content)
-                            else:
-                                continue
+            transcript, video_info = _fetch_ytdlp_cached(video_id, self, proxy)
+        except LookupError as e:
+            return None, None, [("warning", failure) for failure in e.args]
+        except Exception as e:
+            return None, None, [("error", f"yt-dlp failed: {str(e)}")]
+        return transcript, video_info, []
 
-                            if transcript:
-                                return transcript
+    def _extract_ytdlp(self, video_id, proxy=None):
+        """
+        Extracts a transcript with yt-dlp, without memoization.
 
-                        except Exception as e:
-                            st.warning(
-                                f"Failed to process subtitle file {subtitle_file}: {str(e)}"
-                            )
-                            continue
+        Nothing is shown in the app from here, so the result can be cached
+        without replaying stale warnings; problems are raised instead.
+
+        Args:
+            video_id (str): The ID of the YouTube video.
+            proxy (str, optional): The proxy URL to route through. Defaults to None.
 
-                    # If no subtitle files were found, try to get them from the info dict
-                    subtitles = info.get("subtitles", {})
-                    auto_captions = info.get("automatic_captions", {})
-
-                    # Try to find English subtitles
-                    for lang in ["en", "en-US", "en-GB"]:
-                        if lang in subtitles:
-                            return self._download_and_parse_subtitle(
-                                subtitles[lang], use_proxy, proxy_config
-                            )
-                        if lang in auto_captions:
-                            return self._download_and_parse_subtitle(
-                                auto_captions[lang], use_proxy, proxy_config
-                            )
-
-                    # Try any available language
-                    if subtitles:
-                        first_lang = list(subtitles.keys())[0]
-                        return self._download_and_parse_subtitle(
-                            subtitles[first_lang], use_proxy, proxy_config
-                        )
-                    if auto_captions:
-                        first_lang = list(auto_captions.keys())[0]
-                        return self._download_and_parse_subtitle(
-                            auto_captions[first_lang], use_proxy, proxy_config
-                        )
+        Returns:
+            tuple: The list of transcript segments and the video info dictionary.
 
-            return None
+        Raises:
+            LookupError: If the video has no usable subtitles. Its arguments are
+                         the messages for any subtitles that failed to load.
+        """
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        failures = []
+
+        # Create a temporary directory for subtitle files
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Extract info and write the subtitle files in one pass;
+            # skip_download keeps the video itself from being fetched
+            with _ytdlp_client(proxy) as ydl:
+                ydl.params["paths"] = {"home": temp_dir}
+                info = ydl.extract_info(url, download=True)
+
+            video_info = {
+                "video_id": video_id,
+                "url": url,
+                "title": info.get("title", "Unknown Title"),
+                "duration": info.get("duration", 0),
+            }
+
+            # Look for subtitle files in the temp directory, VTT first
+            # since it is the cheaper format to parse
+            with os.scandir(temp_dir) as entries:
+                subtitle_files = sorted(
+                    (
+                        entry.path
+                        for entry in entries
+                        if entry.name.endswith((".vtt", ".srt"))
+                    ),
+                    key=lambda path: not path.endswith(".vtt"),
+                )
 
-        except Exception as e:
-            st.error(f"yt-dlp failed: {str(e)}")
-            return None
+            # Process the first available subtitle file
+            for subtitle_file in subtitle_files:
+                try:
+                    # Feed the parser straight from the buffered file
+                    # instead of reading it into one string first
+                    with open(
+                        subtitle_file,
+                        "r",
+                        encoding="utf-8",
+                        buffering=SUBTITLE_READ_BUFFER,
+                    ) as f:
+                        if subtitle_file.endswith(".vtt"):
+                            transcript = self._parse_vtt_content(f)
+                        else:
+                            transcript = self._parse_srt_content(f)
+
+                    if transcript:
+                        return transcript, video_info
+
+                except Exception as e:
+                    failures.append(
+                        f"Failed to process subtitle file {subtitle_file}: {str(e)}"
+                    )
+
+        # If no subtitle file could be read, download one listed in the info
+        # dict: English first, then the first available language
+        subtitles = info.get("subtitles", {})
+        auto_captions = info.get("automatic_captions", {})
+        subtitle_formats = next(
+            chain(
+                (
+                    tracks[lang]
+                    for lang in DEFAULT_LANGUAGES
+                    for tracks in (subtitles, auto_captions)
+                    if lang in tracks
+                ),
+                (
+                    tracks[next(iter(tracks))]
+                    for tracks in (subtitles, auto_captions)
+                    if tracks
+                ),
+            ),
+            None,
+        )
+        if subtitle_formats:
+            transcript = self._download_and_parse_subtitle(
+                subtitle_formats, proxy is not None, proxy, failures
+            )
+            if transcript:
+                return transcript, video_info
+
+        raise LookupError(*failures)
 
     def _download_and_parse_subtitle(
-        self, subtitle_formats, use_proxy=False, proxy_config=None
+        self, subtitle_formats, use_proxy=False, proxy_config=None, failures=None
     ):
         """
         Downloads and parses subtitle content from yt-dlp subtitle format info.
@@ -419,12 +901,18 @@ class YouTubeTranscriptExtractor:
             subtitle_formats (list): List of subtitle format dictionaries from yt-dlp.
             use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
             proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            failures (list, optional): Collects a message for each format that
+                                       failed, instead of showing it as a
+                                       warning. Defaults to None.
 
         Returns:
             list: A list of transcript segments, or None on failure.
         """
-        import urllib.request
-        import urllib.error
+        proxies = (
+            {"http": proxy_config, "https": proxy_config}
+            if use_proxy and proxy_config
+            else None
+        )
 
         # Try different formats in order of preference
         preferred_formats = ["vtt", "srv3", "srv2", "srv1", "srt"]
@@ -437,35 +925,31 @@ class YouTubeTranscriptExtractor:
                         if not subtitle_url:
                             continue
 
-                        # Set up request with proxy if needed
-                        if use_proxy and proxy_config:
-                            proxy_handler = urllib.request.ProxyHandler(
-                                {"http": proxy_config, "https": proxy_config}
-                            )
-                            opener = urllib.request.build_opener(proxy_handler)
-                            urllib.request.install_opener(opener)
-
-                        # Download subtitle content
-                        with urllib.request.urlopen(
-                            subtitle_url, timeout=30
+                        # Stream the subtitle body straight into the parser,
+                        # decoding (and decompressing) it as lines arrive
+                        with _HTTP_SESSION.get(
+                            subtitle_url, proxies=proxies, timeout=30, stream=True
                         ) as response:
-                            content = response.read().decode("utf-8")
-
-                        # Parse based on format
-                        if format_pref in ["vtt", "srv3", "srv2", "srv1"]:
-                            transcript = self._parse_vtt_content(content)
-                        elif format_pref == "srt":
-                            transcript = self._parse_srt_content(content)
-                        else:
-                            continue
+                            response.raise_for_status()
+                            lines = _iter_response_lines(response)
+
+                            # Parse based on format
+                            if format_pref in ["vtt", "srv3", "srv2", "srv1"]:
+                                transcript = self._parse_vtt_content(lines)
+                            elif format_pref == "srt":
+                                transcript = self._parse_srt_content(lines)
+                            else:
+                                continue
 
                         if transcript:
                             return transcript
 
                     except Exception as e:
-                        st.warning(
-                            f"Failed to download subtitle format {format_pref}: {str(e)}"
-                        )
+                        message = f"Failed to download subtitle format {format_pref}: {str(e)}"
+                        if failures is None:
+                            st.warning(message)
+                        else:
+                            failures.append(message)
                         continue
 
         return None
@@ -484,14 +968,22 @@ class YouTubeTranscriptExtractor:
         # This method is now deprecated and replaced by proper parsing
         return self._download_and_parse_subtitle(subtitle_list)
 
-    def extract_transcript(self, video_url, use_proxy=False, proxy_config=None):
+    def extract_transcript(
+        self, video_url, use_proxy=False, proxy_config=None, languages=None
+    ):
         """
         Main method to extract a transcript, trying the API first and falling back to yt-dlp.
 
+        If the API has not answered within FALLBACK_HEDGE_DELAY seconds, yt-dlp is
+        started alongside it and whichever succeeds first is used, so a slow API
+        failure no longer adds its full latency in front of the fallback.
+
         Args:
             video_url (str): The URL of the YouTube video.
             use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
             proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
 
         Returns:
             tuple: A tuple containing the transcript (list) and a status message (str).
@@ -507,22 +999,131 @@ class YouTubeTranscriptExtractor:
             "extracted_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        # Attempt to get transcript using the YouTube Transcript API
+        transcript, video_info, source, messages = self._race_sources(
+            video_id, use_proxy, proxy_config, languages
+        )
+        _show_messages(messages)
+        if not transcript:
+            return None, "Both transcript extraction methods failed"
+
+        if video_info:
+            self.video_info = {
+                **video_info,
+                "extracted_at": self.video_info["extracted_at"],
+            }
+        self.transcript_data = transcript
+        proxy_status = " (with proxy)" if use_proxy else ""
+        return transcript, f"Success using {source}{proxy_status}"
+
+    def extract_transcripts(
+        self, video_urls, use_proxy=False, proxy_config=None, languages=None
+    ):
+        """
+        Extracts transcripts for several videos concurrently.
+
+        Each video goes through the same API-first race against yt-dlp as
+        extract_transcript, so a failing API fetch only falls back for that
+        video. Up to BATCH_EXTRACTION_CONCURRENCY videos are extracted at once.
+        Nothing is shown in the app and the extractor's video info is left
+        alone, so batches can run outside a Streamlit script.
+
+        Args:
+            video_urls (list): The URLs of the YouTube videos.
+            use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
+            proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
+
+        Returns:
+            list: One ``(transcript, message)`` tuple per URL, in the same order.
+                  Failed extractions have no transcript, and their message
+                  includes the reason each source gave.
+        """
+        proxy_status = " (with proxy)" if use_proxy else ""
+
+        def extract(video_url):
+            video_id = self.extract_video_id(video_url)
+            if not video_id:
+                return None, "Invalid YouTube URL"
+            transcript, _, source, messages = self._race_sources(
+                video_id, use_proxy, proxy_config, languages
+            )
+            if not transcript:
+                reasons = "; ".join(text for _, text in messages)
+                return None, f"Both transcript extraction methods failed: {reasons}"
+            return transcript, f"Success using {source}{proxy_status}"
+
+        with ThreadPoolExecutor(
+            max_workers=min(BATCH_EXTRACTION_CONCURRENCY, len(video_urls) or 1)
+        ) as executor:
+            return list(executor.map(extract, video_urls))
+
+    def _race_sources(
+        self, video_id, use_proxy=False, proxy_config=None, languages=None
+    ):
+        """
+        Fetches a transcript from the API, racing yt-dlp against it when it is slow.
+
+        The attempts run on worker threads and only return results, so nothing
+        is shown and the extractor is left untouched. An attempt still running
+        when the other succeeds is cancelled if it has not started, and
+        otherwise left to finish with its result discarded.
+
+        Args:
+            video_id (str): The ID of the YouTube video.
+            use_proxy (bool, optional): Whether to use a proxy. Defaults to False.
+            proxy_config (str, optional): The proxy configuration string. Defaults to None.
+            languages (tuple, optional): Preferred language codes, in order.
+                                         Defaults to DEFAULT_LANGUAGES.
+
+        Returns:
+            tuple: The list of transcript segments, the video info dictionary
+                   (None unless yt-dlp provided it), the name of the source
+                   that succeeded, and the ``(level, text)`` messages of the
+                   attempts that finished before it. The first three are None
+                   if every attempt failed.
+        """
+        api_future = ytdlp_future = None
+
+        # Attempt to get transcript using the YouTube Transcript API, giving it
+        # a head start before racing it against yt-dlp
         if TRANSCRIPT_API_AVAILABLE:
-            transcript = self.get_transcript_youtube_api(
-                video_id, use_proxy, proxy_config
+            api_future = _API_EXECUTOR.submit(
+                self._try_youtube_api, video_id, use_proxy, proxy_config, languages
+            )
+            wait(
+                [api_future], timeout=FALLBACK_HEDGE_DELAY if YT_DLP_AVAILABLE else None
             )
-            if transcript:
-                self.transcript_data = transcript
-                proxy_status = " (with proxy)" if use_proxy else ""
-                return transcript, f"Success using YouTube Transcript API{proxy_status}"
 
-        # Fallback to yt-dlp if the API fails or is unavailable
-        if YT_DLP_AVAILABLE:
-            transcript = self.get_transcript_ytdlp(video_id, use_proxy, proxy_config)
-            if transcript:
-                self.transcript_data = transcript
-                proxy_status = " (with proxy)" if use_proxy else ""
-                return transcript, f"Success using yt-dlp{proxy_status}"
+        # Fallback to yt-dlp if the API fails, is slow, or is unavailable
+        if YT_DLP_AVAILABLE and not (
+            api_future and api_future.done() and api_future.result()[0]
+        ):
+            ytdlp_future = _YTDLP_EXECUTOR.submit(
+                self._try_ytdlp, video_id, use_proxy, proxy_config
+            )
 
-        return None, "Both transcript extraction methods failed"
+        # The API result is preferred whenever both are ready
+        sources = [
+            (future, name)
+            for future, name in (
+                (api_future, "YouTube Transcript API"),
+                (ytdlp_future, "yt-dlp"),
+            )
+            if future
+        ]
+        messages = []
+        pending = {future for future, _ in sources}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future, name in sources:
+                if future not in done:
+                    continue
+                transcript, video_info, attempt_messages = future.result()
+                messages.extend(attempt_messages)
+                if transcript:
+                    for loser in pending:
+                        loser.cancel()
+                    return transcript, video_info, name, messages
+
+        return None, None, None, messages
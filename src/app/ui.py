@@ -5,17 +5,234 @@ and the main content display areas for transcripts, notes, and chat.
 """
 
 import streamlit as st
+import html
+import json
+import re
+from collections import deque
 from datetime import datetime
-from .utils import create_download_link, display_content_with_actions
-from .gemini_ai import GeminiAI
+from operator import itemgetter
+from .utils import (
+    annotated_transcript_text,
+    create_download_link,
+    display_content_with_actions,
+    paragraphs_text,
+    rerun_fragment,
+    segment_paragraphs,
+)
+from .transcript_extractor import TRANSCRIPT_API_AVAILABLE, YT_DLP_AVAILABLE
+
+# Transcript viewer rendered in a component iframe. Paragraph rows are passed
+# in as JSON and appended in batches as the sentinel scrolls into view, and
+# off-screen rows skip layout and paint via content-visibility, so the browser
+# work stays proportional to what is visible rather than to the video length.
+_TRANSCRIPT_VIEWER_HTML = """
+<style>
+    body {
+        margin: 0;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
 
+    #viewer {
+        height: 400px;
+        overflow-y: auto;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 0.5rem;
+        box-sizing: border-box;
+    }
 
-def custom_css():
+    .paragraph {
+        margin-bottom: 1.5rem;
+        padding: 1rem;
+        border-left: 3px solid #4ECDC4;
+        background: #f8f9fa;
+        border-radius: 0 8px 8px 0;
+        content-visibility: auto;
+        contain-intrinsic-size: auto 120px;
+    }
+
+    .paragraph-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 0.5rem;
+    }
+
+    .paragraph-timestamp {
+        color: #FF6B6B;
+        font-weight: bold;
+        font-size: 0.9rem;
+    }
+
+    .paragraph-number {
+        color: #999;
+        font-size: 0.8rem;
+    }
+
+    .copy-btn {
+        margin-left: 0.5rem;
+        padding: 0 0.3rem;
+        border: none;
+        background: none;
+        cursor: pointer;
+        font-size: 0.9rem;
+    }
+
+    .paragraph-text {
+        margin: 0.5rem 0;
+        line-height: 1.6;
+        color: #2c3e50;
+    }
+
+    .paragraph-note {
+        margin-top: 0.5rem;
+        padding: 0.5rem;
+        background: #e8f5e8;
+        border-radius: 4px;
+        border-left: 3px solid #4ECDC4;
+        color: #2c3e50;
+    }
+</style>
+<div id="viewer">
+    <div id="rows"></div>
+    <div id="sentinel" style="height: 1px;"></div>
+</div>
+<script>
+    const paragraphs = __ROWS__;
+    const BATCH_SIZE = 50;
+    const viewer = document.getElementById("viewer");
+    const list = document.getElementById("rows");
+    const sentinel = document.getElementById("sentinel");
+    let rendered = 0;
+
+    function renderBatch() {
+        const fragment = document.createDocumentFragment();
+        const end = Math.min(rendered + BATCH_SIZE, paragraphs.length);
+        for (; rendered < end; rendered++) {
+            const paragraph = paragraphs[rendered];
+            const row = document.createElement("div");
+            row.className = "paragraph";
+            row.innerHTML =
+                '<div class="paragraph-header">' +
+                '<span class="paragraph-timestamp">[' + paragraph.timestamp + ']</span>' +
+                '<span class="paragraph-number">¶ ' + (rendered + 1) +
+                '<button class="copy-btn" title="Copy this paragraph">📋</button>' +
+                '</span>' +
+                '</div>' +
+                '<div class="paragraph-text">' + paragraph.html + '</div>';
+            if (paragraph.note) {
+                const note = document.createElement("div");
+                note.className = "paragraph-note";
+                note.innerHTML = "<strong>📝 Your Note:</strong> ";
+                note.appendChild(document.createTextNode(paragraph.note));
+                row.appendChild(note);
+            }
+            fragment.appendChild(row);
+        }
+        list.appendChild(fragment);
+    }
+
+    // One delegated handler copies any paragraph straight to the clipboard,
+    // without a Streamlit widget or rerun per row
+    list.addEventListener("click", (event) => {
+        const button = event.target.closest(".copy-btn");
+        if (!button) {
+            return;
+        }
+        const text = button
+            .closest(".paragraph")
+            .querySelector(".paragraph-text").textContent;
+        navigator.clipboard.writeText(text).catch(() => {
+            const textArea = document.createElement("textarea");
+            textArea.value = text;
+            document.body.appendChild(textArea);
+            textArea.select();
+            document.execCommand("copy");
+            document.body.removeChild(textArea);
+        });
+    });
+
+    const observer = new IntersectionObserver(
+        (entries) => {
+            if (entries[0].isIntersecting && rendered < paragraphs.length) {
+                renderBatch();
+                // Re-observe so a still-visible sentinel triggers the next batch
+                observer.unobserve(sentinel);
+                observer.observe(sentinel);
+            }
+        },
+        { root: viewer, rootMargin: "400px" }
+    );
+
+    renderBatch();
+    observer.observe(sentinel);
+</script>
+"""
+
+# Copies the transcript passed in as a JSON string literal, falling back to a
+# hidden textarea where the Clipboard API is unavailable
+_COPY_TRANSCRIPT_JS = """
+<script>
+    const textToCopy = __TEXT__;
+    navigator.clipboard.writeText(textToCopy).then(
+        () => console.log("Transcript copied to clipboard successfully!"),
+        (err) => {
+            console.error("Could not copy transcript: ", err);
+            const textArea = document.createElement("textarea");
+            textArea.value = textToCopy;
+            document.body.appendChild(textArea);
+            textArea.focus();
+            textArea.select();
+            try {
+                if (document.execCommand("copy")) {
+                    console.log("Transcript copied using fallback method!");
+                }
+            } catch (err) {
+                console.error("Fallback copy failed: ", err);
+            }
+            document.body.removeChild(textArea);
+        }
+    );
+</script>
+"""
+
+
+# Number of latest chat answers shown, and the length of the question
+# preview in each answer's header
+CHAT_HISTORY_SHOWN = 5
+CHAT_PREVIEW_LENGTH = 50
+
+# Number of recently copied paragraphs listed under "Copied Paragraphs"
+RECENT_COPIES_SHOWN = 3
+
+# Markup wrapping each search match, keeping the matched text as written
+_SEARCH_HIGHLIGHT = (
+    '<mark style="background-color: #ffeb3b; padding: 2px 4px; border-radius: 3px;">'
+    "{}</mark>"
+)
+
+# Character references produced by html.escape, matched as a whole so a search
+# term never highlights part of one and breaks the escaped paragraph text
+_ESCAPED_ENTITY = "&(?:amp|lt|gt|quot|#x27);"
+
+
+def _highlight_match(match):
     """
-    Applies custom CSS to the Streamlit application for a professional look and feel.
+    Wraps a search match in highlight markup, leaving skipped entities as is.
+
+    Args:
+        match (re.Match): A match of the compiled search pattern.
+
+    Returns:
+        str: The replacement markup.
     """
-    st.markdown(
-        """
+    if match.group(1) is None:
+        return match.group(0)
+    return _SEARCH_HIGHLIGHT.format(match.group(1))
+
+
+# Page-wide styles and header markup, emitted unchanged on every rerun
+_CUSTOM_CSS = """
     <style>
         .main-header {
             background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
@@ -24,33 +241,14 @@ def custom_css():
             text-align: center;
             margin-bottom: 2rem;
         }
-        
+
         .main-header h1 {
             color: white;
             margin: 0;
             font-size: 2.5rem;
             font-weight: bold;
         }
-        
-        .feature-card {
-            background: #f8f9fa;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-left: 4px solid #FF6B6B;
-            margin: 1rem 0;
-        }
-        
-        .transcript-container {
-            background: #ffffff;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 1.5rem;
-            max-height: 400px;
-            overflow-y: auto;
-            margin: 1rem 0;
-            color: #2c3e50;
-    }
-        
+
         .content-display {
             background: #f8f9fa;
             border: 1px solid #e0e0e0;
@@ -61,9 +259,9 @@ def custom_css():
             margin: 1rem 0;
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
-            color: #2c3e50;    
+            color: #2c3e50;
         }
-        
+
         .content-header {
             display: flex;
             justify-content: space-between;
@@ -72,19 +270,19 @@ def custom_css():
             padding-bottom: 0.5rem;
             border-bottom: 2px solid #4ECDC4;
         }
-        
+
         .content-title {
             font-size: 1.2rem;
             font-weight: bold;
             color: #2c3e50;
             margin: 0;
         }
-        
+
         .content-actions {
             display: flex;
             gap: 0.5rem;
         }
-        
+
         .action-btn {
             background: #4ECDC4;
             color: white;
@@ -95,57 +293,19 @@ def custom_css():
             cursor: pointer;
             text-decoration: none;
         }
-        
+
         .action-btn:hover {
             background: #44A08D;
         }
-        
-        .delete-btn {
-            background: #e74c3c;
-        }
-        
-        .delete-btn:hover {
-            background: #c0392b;
-        }
-        
-        .timestamp {
-            color: #FF6B6B;
-            font-weight: bold;
-            font-size: 0.9rem;
-        }
-        
-        .transcript-text {
-            margin: 0.5rem 0;
-            line-height: 1.6;
-        }
-        
-        .insight-card {
-            background: linear-gradient(145deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-        }
-        
-        .action-button {
-            background: linear-gradient(90deg, #4ECDC4, #44A08D);
-            color: white;
-            border: none;
-            padding: 0.8rem 1.5rem;
-            border-radius: 5px;
-            cursor: pointer;
-            margin: 0.5rem;
-            font-weight: bold;
-        }
-        
+
         .video-info {
             background: #f1f3f4;
             padding: 1rem;
             border-radius: 8px;
             margin: 1rem 0;
-            color: #2c3e50;    
+            color: #2c3e50;
         }
-        
+
         .warning-box {
             background: #fff3cd;
             border: 1px solid #ffeaa7;
@@ -154,7 +314,7 @@ def custom_css():
             border-radius: 5px;
             margin: 1rem 0;
         }
-        
+
         .success-box {
             background: #d4edda;
             border: 1px solid #c3e6cb;
@@ -163,62 +323,48 @@ def custom_css():
             border-radius: 5px;
             margin: 1rem 0;
         }
-        
-        .notes-section {
-            background: #2c3e50;
-            color: white;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 1rem 0;
-        }
-        
-        .note-item {
-            background: #34495e;
-            padding: 1rem;
-            border-radius: 6px;
-            margin: 0.5rem 0;
-            border-left: 4px solid #4ECDC4;
-        }
-        
-        .note-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 0.5rem;
-        }
-        
-        .note-type {
-            background: #4ECDC4;
-            color: white;
-            padding: 0.2rem 0.5rem;
-            border-radius: 3px;
-            font-size: 0.8rem;
-            font-weight: bold;
-        }
-        
-        .note-timestamp {
-            color: #bdc3c7;
-            font-size: 0.8rem;
-        }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+_MAIN_HEADER_HTML = """
+    <div class="main-header">
+        <h1>🎬 YouTube Transcript Extractor</h1>
+        <p style="color: white; margin: 0;">Extract, Analyze, and Chat with YouTube Video Transcripts</p>
+    </div>
+    """
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini(api_key):
+    """
+    Returns a configured GeminiAI client, shared across reruns for the same key.
+
+    The Gemini SDK is imported here rather than at module level, so the app
+    starts without loading it until an API key is entered.
+
+    Args:
+        api_key (str): The API key for the Google Gemini service.
+
+    Returns:
+        GeminiAI: The cached GeminiAI instance for this key.
+    """
+    from .gemini_ai import GeminiAI
+
+    return GeminiAI(api_key)
+
+
+def custom_css():
+    """
+    Applies custom CSS to the Streamlit application for a professional look and feel.
+    """
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def main_header():
     """
     Displays the main header of the application.
     """
-    st.markdown(
-        """
-    <div class="main-header">
-        <h1>🎬 YouTube Transcript Extractor</h1>
-        <p style="color: white; margin: 0;">Extract, Analyze, and Chat with YouTube Video Transcripts</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_MAIN_HEADER_HTML, unsafe_allow_html=True)
 
 
 def sidebar():
@@ -272,30 +418,30 @@ def sidebar():
 
         # Display status of available libraries
         st.subheader("📚 Available Libraries")
-        try:
-            from youtube_transcript_api import YouTubeTranscriptApi
-
+        if TRANSCRIPT_API_AVAILABLE:
             st.success("✅ YouTube Transcript API")
-        except ImportError:
+        else:
             st.error(
                 "❌ YouTube Transcript API (install: pip install youtube-transcript-api)"
             )
 
-        try:
-            import yt_dlp
-
+        if YT_DLP_AVAILABLE:
             st.success("✅ yt-dlp")
-        except ImportError:
+        else:
             st.error("❌ yt-dlp (install: pip install yt-dlp)")
 
     return use_proxy, proxy_config, gemini_api_key
 
 
+@st.fragment
 def display_transcript():
     """
     Displays the extracted transcript and related information, including video details,
     search functionality, and an interactive transcript viewer with options to copy,
     download, and add notes.
+
+    Runs as a fragment, so its buttons and inputs rerun only this section
+    instead of the whole app.
     """
     st.subheader("📝 Video Info")
 
@@ -323,6 +469,17 @@ def display_transcript():
 
         if "transcript_notes" not in st.session_state:
             st.session_state.transcript_notes = {}
+        if "recent_copies" not in st.session_state:
+            st.session_state.recent_copies = deque(maxlen=RECENT_COPIES_SHOWN)
+        if "open_note_inputs" not in st.session_state:
+            st.session_state.open_note_inputs = set()
+
+        # Group the segments into paragraphs once, for display, copy and download
+        transcript_tuple = tuple(
+            (entry.get("start", 0), entry["text"])
+            for entry in st.session_state.transcript_data
+        )
+        paragraphs = segment_paragraphs(transcript_tuple)
 
         search_term = st.text_input(
             "🔍 Search in transcript:", placeholder="Enter word or phrase to search..."
@@ -333,59 +490,16 @@ def display_transcript():
         with col1_inner:
             if st.button("📋 Copy Whole Transcript", use_container_width=True):
                 # Logic to copy the entire transcript to the clipboard
-                clean_transcript = ""
-                current_paragraph = []
-
-                for entry in st.session_state.transcript_data:
-                    text = entry["text"].strip()
-                    current_paragraph.append(text)
-
-                    if (
-                        text.endswith(".")
-                        or text.endswith("!")
-                        or text.endswith("?")
-                        or len(current_paragraph) >= 3
-                    ):
-                        clean_transcript += " ".join(current_paragraph) + "\n\n"
-                        current_paragraph = []
-
-                if current_paragraph:
-                    clean_transcript += " ".join(current_paragraph)
+                clean_transcript = paragraphs_text(transcript_tuple)
 
                 st.session_state.clean_transcript_copy = clean_transcript
 
-                js_safe_transcript = clean_transcript.replace("\\", "\\\\").replace(
-                    "`", "\\`"
+                st.components.v1.html(
+                    _COPY_TRANSCRIPT_JS.replace(
+                        "__TEXT__", json.dumps(clean_transcript).replace("</", "<\\/")
+                    ),
+                    height=0,
                 )
-                copy_js = f"""
-                <script>
-                function copyToClipboard() {{
-                    const textToCopy = `{js_safe_transcript}`;
-                    navigator.clipboard.writeText(textToCopy).then(function() {{
-                        console.log('Transcript copied to clipboard successfully!');
-                    }}, function(err) {{
-                        console.error('Could not copy transcript: ', err);
-                        const textArea = document.createElement("textarea");
-                        textArea.value = textToCopy;
-                        document.body.appendChild(textArea);
-                        textArea.focus();
-                        textArea.select();
-                        try {{
-                            const successful = document.execCommand('copy');
-                            if (successful) {{
-                                console.log('Transcript copied using fallback method!');
-                            }}
-                        }} catch (err) {{
-                            console.error('Fallback copy failed: ', err);
-                        }}
-                        document.body.removeChild(textArea);
-                    }});
-                }}
-                copyToClipboard();
-                </script>
-                """
-
-                st.components.v1.html(copy_js, height=0)
                 st.success("✅ Transcript copied to clipboard!")
 
         if st.session_state.get("clean_transcript_copy"):
@@ -400,50 +514,12 @@ def display_transcript():
                 )
 
         with col2_inner:
-            # Logic to download the transcript as a text file
-            def create_download_transcript():
-                clean_transcript = ""
-                current_paragraph = []
-                paragraph_index = 0
-
-                for i, entry in enumerate(st.session_state.transcript_data):
-                    text = entry["text"].strip()
-                    current_paragraph.append(text)
-
-                    if (
-                        text.endswith(".")
-                        or text.endswith("!")
-                        or text.endswith("?")
-                        or len(current_paragraph) >= 3
-                    ):
-                        paragraph_text = " ".join(current_paragraph)
-
-                        if paragraph_index in st.session_state.transcript_notes:
-                            clean_transcript += "--- NOTE SECTION START ---\n"
-                            clean_transcript += paragraph_text + "\n"
-                            clean_transcript += f'"{st.session_state.transcript_notes[paragraph_index]}"\n'
-                            clean_transcript += "--- NOTE SECTION END ---\n\n"
-                        else:
-                            clean_transcript += paragraph_text + "\n\n"
-
-                        current_paragraph = []
-                        paragraph_index += 1
-
-                if current_paragraph:
-                    paragraph_text = " ".join(current_paragraph)
-                    if paragraph_index in st.session_state.transcript_notes:
-                        clean_transcript += "--- NOTE SECTION START ---\n"
-                        clean_transcript += paragraph_text + "\n"
-                        clean_transcript += (
-                            f'"{st.session_state.transcript_notes[paragraph_index]}"\n'
-                        )
-                        clean_transcript += "--- NOTE SECTION END ---\n"
-                    else:
-                        clean_transcript += paragraph_text
-
-                return clean_transcript
-
-            transcript_content = create_download_transcript()
+            # Logic to download the transcript as a text file. The text is
+            # cached per transcript and notes, so reruns skip the join.
+            transcript_content = annotated_transcript_text(
+                transcript_tuple,
+                tuple(sorted(st.session_state.transcript_notes.items())),
+            )
             st.download_button(
                 "📥 Download Transcript",
                 data=transcript_content,
@@ -455,156 +531,114 @@ def display_transcript():
         with col3_inner:
             if st.button("⬇️ Hide Transcript", use_container_width=True):
                 st.session_state.show_transcript = False
-                st.rerun()
-
-        # Process and display the transcript in paragraphs
-        paragraphs = []
-        current_paragraph = []
-        current_timestamps = []
-
-        for entry in st.session_state.transcript_data:
-            text = entry["text"].strip()
-            start_time = entry.get("start", 0)
-            current_paragraph.append(text)
-            current_timestamps.append(start_time)
-
-            if (
-                text.endswith(".")
-                or text.endswith("!")
-                or text.endswith("?")
-                or len(current_paragraph) >= 3
-            ):
-                paragraph_text = " ".join(current_paragraph)
-                start_timestamp = current_timestamps[0]
-                minutes = int(start_timestamp // 60)
-                seconds = int(start_timestamp % 60)
-                timestamp_str = f"{minutes:02d}:{seconds:02d}"
-
-                paragraphs.append(
-                    {
-                        "text": paragraph_text,
-                        "timestamp": timestamp_str,
-                        "start_time": start_timestamp,
-                    }
-                )
-                current_paragraph = []
-                current_timestamps = []
-
-        if current_paragraph:
-            paragraph_text = " ".join(current_paragraph)
-            start_timestamp = current_timestamps[0] if current_timestamps else 0
-            minutes = int(start_timestamp // 60)
-            seconds = int(start_timestamp % 60)
-            timestamp_str = f"{minutes:02d}:{seconds:02d}"
-
-            paragraphs.append(
+                rerun_fragment()
+
+        # Collect the paragraph rows for the virtualized transcript viewer,
+        # highlighting the search term in its original casing. Paragraphs are
+        # already HTML-escaped, so the term is escaped the same way to match.
+        term_pattern = search_pattern = None
+        if search_term:
+            escaped_term = re.escape(html.escape(search_term))
+            term_pattern = re.compile(escaped_term, re.IGNORECASE)
+            search_pattern = re.compile(
+                f"({escaped_term})|{_ESCAPED_ENTITY}", re.IGNORECASE
+            )
+        rows = []
+        for i, paragraph in enumerate(paragraphs):
+            display_text = paragraph["html"]
+            # Only paragraphs containing the term go through the substitution,
+            # whose callback would otherwise also run for every entity
+            if term_pattern and term_pattern.search(display_text):
+                display_text = search_pattern.sub(_highlight_match, display_text)
+
+            rows.append(
                 {
-                    "text": paragraph_text,
-                    "timestamp": timestamp_str,
-                    "start_time": start_timestamp,
+                    "timestamp": paragraph["timestamp"],
+                    "html": display_text,
+                    "note": st.session_state.transcript_notes.get(i, ""),
                 }
             )
 
-        # Scrollable container for the transcript
-        transcript_container = st.container()
-        with transcript_container:
-            with st.container(height=400):
-                for i, paragraph in enumerate(paragraphs):
-                    # Highlight search term if found
-                    display_text = paragraph["text"]
-                    if search_term and search_term.lower() in display_text.lower():
-                        import re
-
-                        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-                        display_text = pattern.sub(
-                            f'<mark style="background-color: #ffeb3b; padding: 2px 4px; border-radius: 3px;">{search_term}</mark>',
-                            display_text,
-                        )
-
-                    # Display each paragraph with timestamp and actions
-                    st.markdown(
-                        f"""
-                    <div style="margin-bottom: 1.5rem; padding: 1rem; border-left: 3px solid #4ECDC4; background: #f8f9fa; border-radius: 0 8px 8px 0;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                            <span style="color: #FF6B6B; font-weight: bold; font-size: 0.9rem;">[{paragraph['timestamp']}]</span>
-                        </div>
-                        <div style="margin: 0.5rem 0; line-height: 1.6; color: #2c3e50;">{display_text}</div>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+        # Scrollable viewer that only builds the paragraphs being scrolled into view
+        st.components.v1.html(
+            _TRANSCRIPT_VIEWER_HTML.replace(
+                "__ROWS__", json.dumps(rows).replace("</", "<\\/")
+            ),
+            height=420,
+        )
 
-                    # Buttons for copying and adding notes to each paragraph
-                    col_copy, col_note, col_spacer = st.columns([1, 1, 4])
-                    with col_copy:
-                        if st.button(
-                            "📋 Copy", key=f"copy_para_{i}", help="Copy this paragraph"
-                        ):
-                            st.session_state[f"copied_text_{i}"] = paragraph["text"]
-                            st.success("✅ Copied to session!")
+        # Copy and note actions for the selected paragraph
+        if paragraphs:
+            i = st.selectbox(
+                "Paragraph",
+                range(len(paragraphs)),
+                format_func=lambda idx: f"¶ {idx+1} [{paragraphs[idx]['timestamp']}]",
+                help="Choose a paragraph to copy or annotate",
+            )
+            paragraph = paragraphs[i]
+
+            col_copy, col_note, col_spacer = st.columns([1, 1, 4])
+            with col_copy:
+                if st.button(
+                    "📋 Copy", key=f"copy_para_{i}", help="Copy this paragraph"
+                ):
+                    copy = (i, paragraph["text"])
+                    if copy in st.session_state.recent_copies:
+                        st.session_state.recent_copies.remove(copy)
+                    st.session_state.recent_copies.append(copy)
+                    st.success("✅ Copied to session!")
+
+            with col_note:
+                if i in st.session_state.transcript_notes:
+                    if st.button(f"✏️ Edit Note", key=f"edit_note_para_{i}"):
+                        st.session_state.open_note_inputs.add(i)
+                        rerun_fragment()
+                elif st.button(
+                    "📝 Note",
+                    key=f"note_para_{i}",
+                    help="Add note to this paragraph",
+                ):
+                    st.session_state.open_note_inputs.add(i)
+
+            # Input area for adding/editing notes
+            if i in st.session_state.open_note_inputs:
+                note_input = st.text_area(
+                    f"Add note for paragraph {i+1}:",
+                    key=f"note_input_para_{i}",
+                    height=80,
+                )
 
-                    with col_note:
-                        if st.button(
-                            "📝 Note",
-                            key=f"note_para_{i}",
-                            help="Add note to this paragraph",
-                        ):
-                            st.session_state[f"show_note_input_{i}"] = True
-
-                    # Input area for adding/editing notes
-                    if st.session_state.get(f"show_note_input_{i}", False):
-                        note_input = st.text_area(
-                            f"Add note for paragraph {i+1}:",
-                            key=f"note_input_para_{i}",
-                            height=80,
-                        )
-
-                        col_save, col_cancel = st.columns([1, 1])
-                        with col_save:
-                            if st.button("💾 Save Note", key=f"save_note_para_{i}"):
-                                if note_input.strip():
-                                    st.session_state.transcript_notes[i] = (
-                                        note_input.strip()
-                                    )
-                                    st.session_state[f"show_note_input_{i}"] = False
-                                    st.success(f"✅ Note saved for paragraph {i+1}")
-                                    st.rerun()
-
-                        with col_cancel:
-                            if st.button("❌ Cancel", key=f"cancel_note_para_{i}"):
-                                st.session_state[f"show_note_input_{i}"] = False
-                                st.rerun()
-
-                    # Display existing note for the paragraph
-                    if i in st.session_state.transcript_notes:
-                        st.markdown(
-                            f"""
-                        <div style="margin-top: 0.5rem; padding: 0.5rem; background: #e8f5e8; border-radius: 4px; border-left: 3px solid #4ECDC4;">
-                            <strong>📝 Your Note:</strong> {st.session_state.transcript_notes[i]}
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
-                        )
-
-                        if st.button(f"✏️ Edit Note", key=f"edit_note_para_{i}"):
-                            st.session_state[f"show_note_input_{i}"] = True
-                            st.rerun()
+                col_save, col_cancel = st.columns([1, 1])
+                with col_save:
+                    if st.button("💾 Save Note", key=f"save_note_para_{i}"):
+                        if note_input.strip():
+                            st.session_state.transcript_notes[i] = note_input.strip()
+                            st.session_state.open_note_inputs.discard(i)
+                            st.success(f"✅ Note saved for paragraph {i+1}")
+                            rerun_fragment()
 
-        # Display recently copied paragraphs
-        copied_texts = []
-        for key in st.session_state.keys():
-            if key.startswith("copied_text_"):
-                para_idx = key.split("_")[-1]
-                copied_texts.append((para_idx, st.session_state[key]))
+                with col_cancel:
+                    if st.button("❌ Cancel", key=f"cancel_note_para_{i}"):
+                        st.session_state.open_note_inputs.discard(i)
+                        rerun_fragment()
 
-        if copied_texts:
+        # Display recently copied paragraphs
+        if st.session_state.recent_copies:
             st.subheader("📋 Copied Paragraphs")
-            for para_idx, text in copied_texts[-3:]:
-                with st.expander(f"Copied Paragraph {int(para_idx)+1}"):
-                    st.text_area("Text:", value=text, height=100, disabled=True)
-                    if st.button(f"Clear", key=f"clear_copied_{para_idx}"):
-                        del st.session_state[f"copied_text_{para_idx}"]
-                        st.rerun()
+            # Keyed by position, since the same paragraph number can be copied
+            # from different transcripts
+            for position, (para_idx, text) in enumerate(st.session_state.recent_copies):
+                with st.expander(f"Copied Paragraph {para_idx + 1}"):
+                    st.text_area(
+                        "Text:",
+                        value=text,
+                        height=100,
+                        disabled=True,
+                        key=f"copied_text_{position}",
+                    )
+                    if st.button(f"Clear", key=f"clear_copied_{position}"):
+                        del st.session_state.recent_copies[position]
+                        rerun_fragment()
 
         # Display a summary of all notes
         if st.session_state.transcript_notes:
@@ -614,39 +648,30 @@ def display_transcript():
                     with st.expander(
                         f"Note for Paragraph {para_idx + 1} [{paragraphs[para_idx]['timestamp']}]"
                     ):
-                        st.write(
-                            "**Paragraph:**", paragraphs[para_idx]["text"][:100] + "..."
-                        )
+                        st.write("**Paragraph:**", paragraphs[para_idx]["preview"])
                         st.write("**Note:**", note)
                         if st.button(
                             f"🗑️ Delete Note", key=f"delete_note_summary_{para_idx}"
                         ):
                             del st.session_state.transcript_notes[para_idx]
-                            st.rerun()
+                            rerun_fragment()
 
 
+@st.fragment
 def display_notes():
     """
     Displays the section for user-generated notes, such as summaries, quotes, etc.
+
+    Runs as a fragment, so deleting a note reruns only this section.
     """
     st.divider()
     st.subheader("📋 Your Notes")
 
-    # Retrieve and sort notes from session state
-    notes = []
-    for key, value in st.session_state.items():
-        if key.startswith("note_") and isinstance(value, dict):
-            note_id = key.replace("note_", "")
-            notes.append(
-                {
-                    "id": note_id,
-                    "content": value["content"],
-                    "type": value["type"],
-                    "timestamp": value["timestamp"],
-                }
-            )
-
-    notes = sorted(notes, key=lambda x: x["timestamp"], reverse=True)
+    # Newest notes first. Notes saved together by Generate All share a
+    # timestamp and keep the order they were saved in.
+    notes = sorted(
+        st.session_state.notes.values(), key=itemgetter("timestamp"), reverse=True
+    )
 
     # Display each note in an expander
     if notes:
@@ -655,7 +680,11 @@ def display_notes():
                 f"📝 {note['type']} - {note['timestamp']}", expanded=False
             ):
                 display_content_with_actions(
-                    note["content"], note["type"], note["type"], note["id"]
+                    note["content"],
+                    note["type"],
+                    note["type"],
+                    note["id"],
+                    note["timestamp"],
                 )
     else:
         st.info(
@@ -663,17 +692,20 @@ def display_notes():
         )
 
 
+@st.fragment
 def display_chat(gemini_api_key):
     """
     Displays the chat interface for interacting with the transcript content.
 
+    Runs as a fragment, so asking a question reruns only this section.
+
     Args:
         gemini_api_key (str): The API key for the Gemini AI model.
     """
     st.divider()
     st.subheader("💬 Chat with Transcript")
 
-    gemini = GeminiAI(gemini_api_key)
+    gemini = get_gemini(gemini_api_key)
 
     # Input for user's question
     chat_question = st.text_input(
@@ -685,12 +717,13 @@ def display_chat(gemini_api_key):
     if st.button("💬 Ask", use_container_width=True) and chat_question:
         with st.spinner("Thinking..."):
             answer = gemini.chat_with_transcript(
-                st.session_state.transcript_text, chat_question
+                st.session_state.transcript_text_clean, chat_question
             )
 
             st.session_state.chat_history.append(
                 {
                     "question": chat_question,
+                    "question_preview": chat_question[:CHAT_PREVIEW_LENGTH],
                     "answer": answer,
                     "timestamp": datetime.now().strftime("%H:%M:%S"),
                 }
@@ -699,7 +732,7 @@ def display_chat(gemini_api_key):
     # Display chat history
     if st.session_state.chat_history:
         st.markdown("### 💭 Chat History")
-        for i, chat in enumerate(reversed(st.session_state.chat_history[-5:])):
-            with st.expander(f"Q: {chat['question'][:50]}... ({chat['timestamp']})"):
+        for chat in st.session_state.chat_history[: -CHAT_HISTORY_SHOWN - 1 : -1]:
+            with st.expander(f"Q: {chat['question_preview']}... ({chat['timestamp']})"):
                 st.write("**Question:**", chat["question"])
                 st.write("**Answer:**", chat["answer"])
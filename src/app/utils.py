@@ -6,7 +6,167 @@ interactive actions like downloading and deleting.
 
 import streamlit as st
 import base64
+import html
 from datetime import datetime
+from streamlit.errors import StreamlitAPIException
+
+
+def format_timestamp(seconds):
+    """
+    Formats a position in the video as a ``MM:SS`` timestamp.
+
+    Args:
+        seconds (float): The offset from the start of the video, in seconds.
+
+    Returns:
+        str: The timestamp, with minutes zero-padded to at least two digits.
+    """
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+# Caption text ending in one of these closes the current transcript paragraph,
+# including the full-width forms used in CJK captions
+SENTENCE_TERMINATORS = (".", "!", "?", "。", "！", "？")
+
+# Maximum number of caption segments grouped into one transcript paragraph
+PARAGRAPH_MAX_SEGMENTS = 3
+
+# Number of characters of a paragraph shown beside its note in the summary
+PARAGRAPH_PREVIEW_LENGTH = 100
+
+# Rendered note blocks kept across reruns, roughly one per saved note
+NOTE_MARKUP_CACHE_SIZE = 32
+
+
+def _paragraph(segments, start_time):
+    """
+    Builds the paragraph entry for a run of caption segments.
+
+    Args:
+        segments (list): The stripped caption texts in the paragraph.
+        start_time (float): The start of the first segment, in seconds.
+
+    Returns:
+        dict: The paragraph's ``text``, ``html``, ``preview``, ``timestamp``
+              and ``start_time``.
+    """
+    text = " ".join(segments)
+    preview = text
+    if len(text) > PARAGRAPH_PREVIEW_LENGTH:
+        preview = text[:PARAGRAPH_PREVIEW_LENGTH] + "..."
+    return {
+        "text": text,
+        "html": html.escape(text),
+        "preview": preview,
+        "timestamp": format_timestamp(start_time),
+        "start_time": start_time,
+    }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def segment_paragraphs(transcript_tuple):
+    """
+    Groups transcript segments into paragraphs for display, copying and download.
+
+    A paragraph ends after a segment that finishes a sentence, or once it holds
+    PARAGRAPH_MAX_SEGMENTS segments.
+
+    Args:
+        transcript_tuple (tuple): Immutable ``(start, text)`` pairs, so the
+                                  result can be cached across reruns.
+
+    Returns:
+        list: One dictionary per paragraph with its ``text``, its HTML-escaped
+              ``html`` for display, a short ``preview``, ``timestamp`` and
+              ``start_time``.
+    """
+    paragraphs = []
+    current_paragraph = []
+    start_time = 0
+
+    for start, text in transcript_tuple:
+        text = text.strip()
+        if not current_paragraph:
+            start_time = start
+        current_paragraph.append(text)
+
+        if (
+            text.endswith(SENTENCE_TERMINATORS)
+            or len(current_paragraph) >= PARAGRAPH_MAX_SEGMENTS
+        ):
+            paragraphs.append(_paragraph(current_paragraph, start_time))
+            current_paragraph = []
+
+    if current_paragraph:
+        paragraphs.append(_paragraph(current_paragraph, start_time))
+
+    return paragraphs
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def paragraphs_text(transcript_tuple):
+    """
+    Joins the transcript paragraphs into plain text for copying.
+
+    Args:
+        transcript_tuple (tuple): Immutable ``(start, text)`` pairs, so the
+                                  result can be cached across reruns.
+
+    Returns:
+        str: The paragraph texts without timestamps, separated by blank lines.
+    """
+    return "\n\n".join(
+        paragraph["text"] for paragraph in segment_paragraphs(transcript_tuple)
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def annotated_transcript_text(transcript_tuple, notes):
+    """
+    Joins the transcript paragraphs into plain text for download, with notes.
+
+    Each annotated paragraph is wrapped in a note section that ends with the
+    note in quotes.
+
+    Args:
+        transcript_tuple (tuple): Immutable ``(start, text)`` pairs, so the
+                                  result can be cached across reruns.
+        notes (tuple): ``(paragraph_index, note)`` pairs, sorted by index so
+                       the same notes always give the same cache key.
+
+    Returns:
+        str: The paragraph texts and note sections, separated by blank lines.
+    """
+    if not notes:
+        return paragraphs_text(transcript_tuple)
+
+    notes = dict(notes)
+    sections = []
+    for paragraph_index, paragraph in enumerate(segment_paragraphs(transcript_tuple)):
+        note = notes.get(paragraph_index)
+        if note is not None:
+            sections.append(
+                "--- NOTE SECTION START ---\n"
+                f"{paragraph['text']}\n"
+                f'"{note}"\n'
+                "--- NOTE SECTION END ---"
+            )
+        else:
+            sections.append(paragraph["text"])
+    return "\n\n".join(sections)
+
+
+def rerun_fragment():
+    """
+    Reruns only the fragment currently executing, or the whole app when the
+    fragment is being run as part of a full script run.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # Streamlit only allows fragment-scoped reruns during fragment reruns
+        st.rerun()
 
 
 def create_download_link(content, filename, content_type="text/markdown"):
@@ -26,22 +186,23 @@ def create_download_link(content, filename, content_type="text/markdown"):
     return f'<a href="data:{content_type};base64,{b64}" download="{filename}" class="action-btn">📥 Download</a>'
 
 
-def display_content_with_actions(content, title, content_type, note_id):
+@st.cache_data(ttl=3600, max_entries=NOTE_MARKUP_CACHE_SIZE, show_spinner=False)
+def _content_markup(content, title, filename):
     """
-    Displays content in a styled container with actions like download and delete.
+    Builds the styled HTML block for a note, with its download link.
+
+    The block is cached, so a note's content is base64-encoded and formatted
+    once rather than on every rerun that displays it.
 
     Args:
         content (str): The content to be displayed.
         title (str): The title to be shown in the content header.
-        content_type (str): The type of content (e.g., "Summary", "Key Quotes").
-        note_id (str): A unique identifier for the note to handle actions.
-    """
+        filename (str): The name of the file offered for download.
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{content_type.lower().replace(' ', '_')}_{timestamp}.md"
-
-    st.markdown(
-        f"""
+    Returns:
+        str: The HTML for the note.
+    """
+    return f"""
     <div class="content-display">
         <div class="content-header">
             <h3 class="content-title">{title}</h3>
@@ -51,14 +212,38 @@ def display_content_with_actions(content, title, content_type, note_id):
         </div>
         <div style="white-space: pre-wrap;">{content}</div>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+
+def display_content_with_actions(
+    content, title, content_type, note_id, created_at=None
+):
+    """
+    Displays content in a styled container with actions like download and delete.
+
+    Deleting reruns only the enclosing fragment when called from inside one.
+
+    Args:
+        content (str): The content to be displayed.
+        title (str): The title to be shown in the content header.
+        content_type (str): The type of content (e.g., "Summary", "Key Quotes").
+        note_id (str): The note's key in ``st.session_state.notes``.
+        created_at (str, optional): When the note was saved, as
+                                    ``YYYY-MM-DD HH:MM:SS``. Used in the
+                                    download filename so it stays the same
+                                    across reruns. Defaults to the current time.
+    """
+
+    created = datetime.fromisoformat(created_at) if created_at else datetime.now()
+    timestamp = created.strftime("%Y%m%d_%H%M%S")
+    filename = f"{content_type.lower().replace(' ', '_')}_{timestamp}.md"
+
+    st.markdown(_content_markup(content, title, filename), unsafe_allow_html=True)
 
     # Delete button to remove the note from the session state
     if st.button(
         f"🗑️ Delete {content_type}", key=f"delete_{note_id}", help="Delete this note"
     ):
-        if f"note_{note_id}" in st.session_state:
-            del st.session_state[f"note_{note_id}"]
-            st.rerun()
+        if note_id in st.session_state.notes:
+            del st.session_state.notes[note_id]
+            rerun_fragment()
@@ -5,11 +5,8 @@ License: MIT
 Repository: https://github.com/nova-cortex/yt-transcript-gpt
 """
 
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
+# Both `streamlit run src/main.py` and `python src/main.py` put this file's
+# directory first on sys.path, so the app package imports without path setup.
 from app.main import main
 
 if __name__ == "__main__":
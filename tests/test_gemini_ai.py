@@ -5,7 +5,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 import unittest
 from unittest.mock import patch, MagicMock
-from src.app.gemini_ai import GeminiAI
+from src.app.gemini_ai import (
+    GeminiAI,
+    CONTEXT_CACHE_MIN_CHARS,
+    CONTEXT_CACHE_SLOTS,
+    CONTEXT_CACHE_TTL,
+)
 
 
 class TestGeminiAI(unittest.TestCase):
@@ -29,6 +34,16 @@ class TestGeminiAI(unittest.TestCase):
             mock_model.assert_called_once_with("gemini-1.5-flash")
             self.assertIsNotNone(gemini_ai.model)
 
+    @patch("src.app.gemini_ai.genai_client.get_default_generative_client")
+    @patch("src.app.gemini_ai.genai.configure")
+    def test_requests_use_own_api_key(self, mock_configure, mock_get_client):
+        other = GeminiAI(api_key="other_key")
+        for client, key in ((self.gemini_ai, self.api_key), (other, "other_key")):
+            model = MagicMock(_client=None)
+            client._bind_client(model)
+            mock_configure.assert_called_with(api_key=key)
+            self.assertIs(model._client, mock_get_client.return_value)
+
     def test_initialization_without_key(self):
         gemini_ai_no_key = GeminiAI(api_key=None)
         self.assertIsNone(gemini_ai_no_key.model)
@@ -39,6 +54,102 @@ class TestGeminiAI(unittest.TestCase):
         gemini_ai_no_key = GeminiAI(api_key=None)
         self.assertFalse(gemini_ai_no_key.is_configured())
 
+    def test_generate_dispatch(self):
+        mock_response = MagicMock()
+        mock_response.text = "Generated content."
+        self.mock_model_instance.generate_content.return_value = mock_response
+
+        result = self.gemini_ai.generate("flashcards", self.transcript_text)
+        self.assertEqual(result, "Generated content.")
+        prompt = self.mock_model_instance.generate_content.call_args.args[0]
+        self.assertIn("flashcards", prompt)
+        self.assertIn(self.transcript_text, prompt)
+
+    def test_prime_transcript_too_short(self):
+        self.assertFalse(self.gemini_ai.prime_transcript(self.transcript_text))
+
+    @patch("src.app.gemini_ai.genai.GenerativeModel.from_cached_content")
+    @patch("google.generativeai.caching.CachedContent.create")
+    def test_prime_transcript_uses_cached_context(self, mock_create, mock_from_cache):
+        long_transcript = "word " * (CONTEXT_CACHE_MIN_CHARS // 5 + 1)
+        context_model = MagicMock()
+        context_model.generate_content.return_value = MagicMock(text="Summary.")
+        mock_from_cache.return_value = context_model
+
+        self.assertTrue(self.gemini_ai.prime_transcript(long_transcript))
+        summary = self.gemini_ai.generate_summary(long_transcript)
+        self.assertEqual(summary, "Summary.")
+        mock_create.assert_called_once()
+        prompt = context_model.generate_content.call_args.args[0]
+        self.assertNotIn(long_transcript, prompt)
+        self.mock_model_instance.generate_content.assert_not_called()
+
+    @patch("src.app.gemini_ai.time.monotonic")
+    @patch("src.app.gemini_ai.genai.GenerativeModel.from_cached_content")
+    @patch("google.generativeai.caching.CachedContent.create")
+    def test_prime_transcript_expires(self, mock_create, mock_from_cache, mock_time):
+        long_transcript = "word " * (CONTEXT_CACHE_MIN_CHARS // 5 + 1)
+        mock_time.return_value = 0.0
+        self.assertTrue(self.gemini_ai.prime_transcript(long_transcript))
+        self.assertTrue(self.gemini_ai.prime_transcript(long_transcript))
+        mock_create.assert_called_once()
+
+        # Past the TTL, requests go inline and priming creates a new cache
+        mock_time.return_value = CONTEXT_CACHE_TTL.total_seconds()
+        self.mock_model_instance.generate_content.return_value = MagicMock(
+            text="Summary."
+        )
+        self.assertEqual(self.gemini_ai.generate_summary(long_transcript), "Summary.")
+        mock_from_cache.return_value.generate_content.assert_not_called()
+        self.assertTrue(self.gemini_ai.prime_transcript(long_transcript))
+        self.assertEqual(mock_create.call_count, 2)
+
+    @patch("src.app.gemini_ai.genai.GenerativeModel.from_cached_content")
+    @patch("google.generativeai.caching.CachedContent.create")
+    def test_cached_context_failure_retries_inline(self, mock_create, mock_from_cache):
+        long_transcript = "word " * (CONTEXT_CACHE_MIN_CHARS // 5 + 1)
+        context_model = MagicMock()
+        context_model.generate_content.side_effect = Exception("Cache not found")
+        mock_from_cache.return_value = context_model
+        self.mock_model_instance.generate_content.return_value = MagicMock(
+            text="Summary."
+        )
+
+        self.assertTrue(self.gemini_ai.prime_transcript(long_transcript))
+        self.assertEqual(self.gemini_ai.generate_summary(long_transcript), "Summary.")
+        prompt = self.mock_model_instance.generate_content.call_args.args[0]
+        self.assertIn(long_transcript, prompt)
+        mock_create.return_value.delete.assert_called_once()
+
+        # The failed context is dropped, so later requests go straight inline
+        self.gemini_ai.generate_qa(long_transcript)
+        context_model.generate_content.assert_called_once()
+
+    @patch("src.app.gemini_ai.genai.GenerativeModel.from_cached_content")
+    @patch("google.generativeai.caching.CachedContent.create")
+    def test_prime_transcript_evicts_oldest(self, mock_create, mock_from_cache):
+        caches = [MagicMock() for _ in range(CONTEXT_CACHE_SLOTS + 1)]
+        mock_create.side_effect = caches
+        for i in range(CONTEXT_CACHE_SLOTS + 1):
+            transcript = f"{i} " + "word " * (CONTEXT_CACHE_MIN_CHARS // 5 + 1)
+            self.assertTrue(self.gemini_ai.prime_transcript(transcript))
+
+        caches[0].delete.assert_called_once()
+        for cache in caches[1:]:
+            cache.delete.assert_not_called()
+
+    @patch("google.generativeai.caching.CachedContent.create")
+    def test_prime_transcript_failure_falls_back(self, mock_create):
+        long_transcript = "word " * (CONTEXT_CACHE_MIN_CHARS // 5 + 1)
+        mock_create.side_effect = Exception("API Error")
+        self.mock_model_instance.generate_content.return_value = MagicMock(
+            text="Summary."
+        )
+
+        self.assertFalse(self.gemini_ai.prime_transcript(long_transcript))
+        self.assertEqual(self.gemini_ai.generate_summary(long_transcript), "Summary.")
+        self.mock_model_instance.generate_content.assert_called_once()
+
     def test_generate_summary_success(self):
         mock_response = MagicMock()
         mock_response.text = "This is a summary."
@@ -55,6 +166,58 @@ class TestGeminiAI(unittest.TestCase):
         self.assertIn("Error generating summary", summary)
         self.assertIn("API Error", summary)
 
+    def test_generate_summary_cached(self):
+        mock_response = MagicMock()
+        mock_response.text = "This is a summary."
+        self.mock_model_instance.generate_content.return_value = mock_response
+
+        first = self.gemini_ai.generate_summary(self.transcript_text)
+        second = self.gemini_ai.generate_summary(self.transcript_text)
+        self.assertEqual(first, second)
+        self.mock_model_instance.generate_content.assert_called_once()
+
+    def test_generate_summary_failure_not_cached(self):
+        mock_response = MagicMock()
+        mock_response.text = "This is a summary."
+        self.mock_model_instance.generate_content.side_effect = [
+            Exception("API Error"),
+            mock_response,
+        ]
+
+        self.assertIn(
+            "Error generating summary",
+            self.gemini_ai.generate_summary(self.transcript_text),
+        )
+        self.assertEqual(
+            self.gemini_ai.generate_summary(self.transcript_text), "This is a summary."
+        )
+
+    def test_generate_summary_stream_populates_cache(self):
+        chunks = [MagicMock(text="This is "), MagicMock(text="a summary.")]
+        self.mock_model_instance.generate_content.return_value = iter(chunks)
+
+        "".join(self.gemini_ai.generate_summary(self.transcript_text, stream=True))
+        summary = self.gemini_ai.generate_summary(self.transcript_text)
+        self.assertEqual(summary, "This is a summary.")
+        self.mock_model_instance.generate_content.assert_called_once()
+
+    def test_generate_summary_stream(self):
+        chunks = [MagicMock(text="This is "), MagicMock(text="a summary.")]
+        self.mock_model_instance.generate_content.return_value = iter(chunks)
+
+        stream = self.gemini_ai.generate_summary(self.transcript_text, stream=True)
+        self.assertEqual("".join(stream), "This is a summary.")
+        self.mock_model_instance.generate_content.assert_called_once()
+        self.assertTrue(
+            self.mock_model_instance.generate_content.call_args.kwargs["stream"]
+        )
+
+    def test_generate_summary_stream_failure(self):
+        self.mock_model_instance.generate_content.side_effect = Exception("API Error")
+
+        stream = self.gemini_ai.generate_summary(self.transcript_text, stream=True)
+        self.assertIn("Error generating summary", "".join(stream))
+
     def test_extract_key_quotes_success(self):
         mock_response = MagicMock()
         mock_response.text = "These are key quotes."
@@ -135,6 +298,25 @@ class TestGeminiAI(unittest.TestCase):
         )
         self.assertEqual(answer, "This is an answer.")
 
+    def test_chat_with_transcript_cached(self):
+        mock_response = MagicMock()
+        mock_response.text = "This is an answer."
+        self.mock_model_instance.generate_content.return_value = mock_response
+
+        first = self.gemini_ai.chat_with_transcript(
+            self.transcript_text, "What {is} this?"
+        )
+        second = self.gemini_ai.chat_with_transcript(
+            self.transcript_text, "What {is} this?"
+        )
+        self.gemini_ai.chat_with_transcript(self.transcript_text, "Why?")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_model_instance.generate_content.call_count, 2)
+        prompt = self.mock_model_instance.generate_content.call_args_list[0][0][0]
+        self.assertIn("User Question: What {is} this?", prompt)
+        self.assertIn(self.transcript_text, prompt)
+
     def test_chat_with_transcript_failure(self):
         self.mock_model_instance.generate_content.side_effect = Exception("API Error")
 
@@ -143,6 +325,36 @@ class TestGeminiAI(unittest.TestCase):
         )
         self.assertIn("Error in chat", answer)
 
+    def test_generate_all_success(self):
+        mock_response = MagicMock()
+        mock_response.text = "Generated content."
+        self.mock_model_instance.generate_content.return_value = mock_response
+
+        results = self.gemini_ai.generate_all(self.transcript_text)
+        self.assertEqual(
+            list(results),
+            ["summary", "quotes", "study_guide", "qa", "flashcards", "insights"],
+        )
+        self.assertEqual(list(results.values()), ["Generated content."] * 6)
+        self.assertEqual(self.mock_model_instance.generate_content.call_count, 6)
+
+        # A second run works too, and is served from the response cache
+        self.assertEqual(self.gemini_ai.generate_all(self.transcript_text), results)
+        self.assertEqual(self.mock_model_instance.generate_content.call_count, 6)
+
+    def test_generate_all_partial_failure(self):
+        def generate_content(prompt):
+            if "impactful quotes" in prompt:
+                raise Exception("API Error")
+            return MagicMock(text="Generated content.")
+
+        self.mock_model_instance.generate_content.side_effect = generate_content
+
+        results = self.gemini_ai.generate_all(self.transcript_text)
+        self.assertEqual(results["summary"], "Generated content.")
+        self.assertIn("Error extracting quotes", results["quotes"])
+        self.assertIn("API Error", results["quotes"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,24 +3,51 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import asyncio
+import io
+import threading
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
-from src.app.transcript_extractor import YouTubeTranscriptExtractor
+import requests
+import requests_mock
+from unittest.mock import patch, MagicMock
+from src.app.transcript_extractor import (
+    YouTubeTranscriptExtractor,
+    _HTTP_SESSION,
+    _YTDLP_CLIENTS,
+    _ytdlp_client,
+    _fetch_transcript_cached,
+    _fetch_ytdlp_cached,
+    _parse_fixed_timestamp,
+    fetch_transcripts_async,
+)
+
+_URL_FIXTURES = (
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30s", "dQw4w9WgXcQ"),
+    ("https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://youtu.be/dQw4w9WgXcQ?si=abc", "dQw4w9WgXcQ"),
+    ("youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+)
 
 
 class TestYouTubeTranscriptExtractor(unittest.TestCase):
 
     def setUp(self):
+        _fetch_transcript_cached.clear()
+        _fetch_ytdlp_cached.clear()
+        _YTDLP_CLIENTS.clear()
         self.extractor = YouTubeTranscriptExtractor()
 
     def test_extract_video_id(self):
-        urls = {
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ": "dQw4w9WgXcQ",
-            "https://youtu.be/dQw4w9WgXcQ": "dQw4w9WgXcQ",
-            "https://www.youtube.com/embed/dQw4w9WgXcQ": "dQw4w9WgXcQ",
-        }
-        for url, expected_id in urls.items():
-            self.assertEqual(self.extractor.extract_video_id(url), expected_id)
+        for url, expected_id in _URL_FIXTURES:
+            with self.subTest(url=url):
+                self.assertEqual(self.extractor.extract_video_id(url), expected_id)
+
+    def test_extract_video_id_invalid(self):
+        self.assertIsNone(self.extractor.extract_video_id("not a youtube url"))
 
     @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
     def test_get_transcript_youtube_api_success(self, mock_api):
@@ -38,55 +65,270 @@ class TestYouTubeTranscriptExtractor(unittest.TestCase):
         transcript = self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
         self.assertIsNone(transcript)
 
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_languages(self, mock_api):
+        mock_api.get_transcript.return_value = [{"text": "hola", "start": 0.0}]
+        self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        mock_api.get_transcript.assert_called_once_with(
+            "dQw4w9WgXcQ", languages=["en", "en-US", "en-GB"]
+        )
+
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_cached(self, mock_api):
+        mock_api.get_transcript.return_value = [
+            {"text": "hello world", "start": 0.0, "duration": 1.0}
+        ]
+        first = self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        second = self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        self.assertEqual(first, second)
+        mock_api.get_transcript.assert_called_once()
+
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_proxy_cached(self, mock_api):
+        mock_api.get_transcript.return_value = [{"text": "via proxy", "start": 0.0}]
+        proxy = "http://proxy.example.com:8080"
+        first = self.extractor.get_transcript_youtube_api(
+            "dQw4w9WgXcQ", use_proxy=True, proxy_config=proxy
+        )
+        second = self.extractor.get_transcript_youtube_api(
+            "dQw4w9WgXcQ", use_proxy=True, proxy_config=proxy
+        )
+        self.assertEqual(first, second)
+        mock_api.get_transcript.assert_called_once_with(
+            "dQw4w9WgXcQ",
+            languages=["en", "en-US", "en-GB"],
+            proxies={"http": proxy, "https": proxy},
+        )
+
+    @patch("src.app.transcript_extractor._transcript_api", None)
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_shares_session(self, mock_api):
+        # Releases from 1.0 on fetch through a client instance instead
+        del mock_api.get_transcript
+        mock_api.return_value.fetch.return_value.to_raw_data.return_value = [
+            {"text": "hello world", "start": 0.0, "duration": 1.0}
+        ]
+        self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        transcript = self.extractor.get_transcript_youtube_api("M7lc1UVf-VE")
+        self.assertEqual(transcript[0]["text"], "hello world")
+        mock_api.assert_called_once_with(http_client=_HTTP_SESSION)
+        mock_api.return_value.fetch.assert_called_with(
+            "M7lc1UVf-VE", languages=["en", "en-US", "en-GB"]
+        )
+
+    @patch("src.app.transcript_extractor.time.sleep")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_retries_transient(self, mock_api, mock_sleep):
+        mock_api.get_transcript.side_effect = [
+            requests.ConnectionError("reset"),
+            [{"text": "hello world", "start": 0.0, "duration": 1.0}],
+        ]
+        transcript = self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        self.assertEqual(transcript[0]["text"], "hello world")
+        self.assertEqual(mock_api.get_transcript.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @patch("src.app.transcript_extractor.time.sleep")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_no_retry_on_error(self, mock_api, mock_sleep):
+        mock_api.get_transcript.side_effect = Exception("Transcripts disabled")
+        self.assertIsNone(self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ"))
+        mock_api.get_transcript.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("src.app.transcript_extractor.time.sleep")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_http_status_retries(self, mock_api, mock_sleep):
+        def http_error(status_code):
+            return requests.HTTPError(response=MagicMock(status_code=status_code))
+
+        mock_api.get_transcript.side_effect = [
+            http_error(429),
+            [{"text": "hello world", "start": 0.0, "duration": 1.0}],
+        ]
+        transcript = self.extractor.get_transcript_youtube_api("dQw4w9WgXcQ")
+        self.assertEqual(transcript[0]["text"], "hello world")
+        mock_sleep.assert_called_once()
+
+        mock_api.get_transcript.reset_mock()
+        mock_sleep.reset_mock()
+        mock_api.get_transcript.side_effect = http_error(404)
+        self.assertIsNone(self.extractor.get_transcript_youtube_api("M7lc1UVf-VE"))
+        mock_api.get_transcript.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("src.app.transcript_extractor.time.sleep")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_get_transcript_youtube_api_wrapped_http_status(self, mock_api, mock_sleep):
+        from youtube_transcript_api import YouTubeRequestFailed
+
+        def request_failed(status_code):
+            # Raised the way the library does, while handling the HTTP error
+            try:
+                raise requests.HTTPError(
+                    f"{status_code} Client Error: for url: https://www.youtube.com",
+                    response=MagicMock(status_code=status_code),
+                )
+            except requests.HTTPError as error:
+                try:
+                    raise YouTubeRequestFailed("dQw4w9WgXcQ", error)
+                except YouTubeRequestFailed as wrapped:
+                    return wrapped
+
+        transient = (requests.RequestException, YouTubeRequestFailed)
+        with patch("src.app.transcript_extractor._TRANSIENT_ERRORS", transient):
+            mock_api.get_transcript.side_effect = request_failed(404)
+            self.assertIsNone(self.extractor.get_transcript_youtube_api("M7lc1UVf-VE"))
+            mock_api.get_transcript.assert_called_once()
+            mock_sleep.assert_not_called()
+
+            # The status is also read from the message when nothing is chained
+            mock_api.get_transcript.reset_mock()
+            mock_api.get_transcript.side_effect = YouTubeRequestFailed(
+                "dQw4w9WgXcQ", requests.HTTPError("403 Client Error: Forbidden")
+            )
+            self.assertIsNone(self.extractor.get_transcript_youtube_api("9bZkp7q19f0"))
+            mock_api.get_transcript.assert_called_once()
+            mock_sleep.assert_not_called()
+
+            mock_api.get_transcript.reset_mock()
+            mock_api.get_transcript.side_effect = [
+                request_failed(503),
+                [{"text": "hello world", "start": 0.0, "duration": 1.0}],
+            ]
+            transcript = self.extractor.get_transcript_youtube_api("jNQXAC9IVRw")
+            self.assertEqual(transcript[0]["text"], "hello world")
+            mock_sleep.assert_called_once()
+
+    @patch("src.app.transcript_extractor.YouTubeTranscriptApi")
+    def test_fetch_transcripts_async(self, mock_api):
+        def fake_get_transcript(video_id, languages=None):
+            if video_id == "missingvid0":
+                raise Exception("No transcript")
+            return [{"text": video_id, "start": 0.0, "duration": 1.0}]
+
+        mock_api.get_transcript.side_effect = fake_get_transcript
+        results = asyncio.run(
+            fetch_transcripts_async(["dQw4w9WgXcQ", "missingvid0", "9bZkp7q19f0"])
+        )
+        self.assertEqual(results[0][0]["text"], "dQw4w9WgXcQ")
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(results[2][0]["text"], "9bZkp7q19f0")
+
     @patch("src.app.transcript_extractor.tempfile.TemporaryDirectory")
-    @patch("src.app.transcript_extractor.os.listdir")
+    @patch("src.app.transcript_extractor.os.scandir")
     @patch(
         "builtins.open",
-        new_callable=mock_open,
-        read_data="WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhello from ytdlp",
+        side_effect=lambda *args, **kwargs: io.StringIO(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhello from ytdlp"
+        ),
     )
     @patch("src.app.transcript_extractor.yt_dlp")
     def test_get_transcript_ytdlp_success(
-        self, mock_ytdlp, mock_file, mock_listdir, mock_tempdir
+        self, mock_ytdlp, mock_file, mock_scandir, mock_tempdir
     ):
         # Mock the temporary directory
         mock_temp_path = "/tmp/test"
         mock_tempdir.return_value.__enter__.return_value = mock_temp_path
 
         # Mock the yt-dlp instance
-        mock_ydl_instance = MagicMock()
+        mock_ydl_instance = MagicMock(params={})
         mock_ydl_instance.extract_info.return_value = {
             "title": "Test Video",
             "duration": 60,
             "subtitles": {},
             "automatic_captions": {},
         }
-        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ytdlp.YoutubeDL.return_value = mock_ydl_instance
 
         # Mock file listing to return a VTT file
-        mock_listdir.return_value = ["test_video.en.vtt"]
+        mock_entry = MagicMock()
+        mock_entry.name = "test_video.en.vtt"
+        mock_entry.path = os.path.join(mock_temp_path, mock_entry.name)
+        mock_scandir.return_value.__enter__.return_value = [mock_entry]
 
         transcript = self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ")
         self.assertIsNotNone(transcript)
         if transcript:
             self.assertEqual(transcript[0]["text"], "hello from ytdlp")
+        mock_ydl_instance.extract_info.assert_called_once_with(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", download=True
+        )
+        mock_ydl_instance.download.assert_not_called()
+        self.assertEqual(mock_ydl_instance.params["paths"], {"home": mock_temp_path})
+
+        self.assertEqual(self.extractor.video_info["title"], "Test Video")
+
+        # A repeat extraction is served from the cache
+        self.assertEqual(self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ"), transcript)
+        mock_ydl_instance.extract_info.assert_called_once()
+
+        # The client is kept for the next extraction through the same route
+        _fetch_ytdlp_cached.clear()
+        self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ")
+        mock_ytdlp.YoutubeDL.assert_called_once()
+        self.assertEqual(mock_ydl_instance.extract_info.call_count, 2)
+
+    @patch("src.app.transcript_extractor.yt_dlp")
+    def test_ytdlp_client_pool(self, mock_ytdlp):
+        mock_ytdlp.YoutubeDL.side_effect = lambda options: MagicMock()
+
+        # Concurrent extractions each get a client of their own
+        with _ytdlp_client() as first, _ytdlp_client() as second:
+            self.assertIsNot(first, second)
+        with _ytdlp_client() as reused:
+            self.assertIn(reused, (first, second))
+        self.assertEqual(mock_ytdlp.YoutubeDL.call_count, 2)
+
+        with _ytdlp_client("http://proxy:8080") as proxied:
+            self.assertNotIn(proxied, (first, second))
+        self.assertEqual(
+            mock_ytdlp.YoutubeDL.call_args.args[0]["proxy"], "http://proxy:8080"
+        )
+
+    @patch("src.app.transcript_extractor.st.warning")
+    @patch("src.app.transcript_extractor.os.scandir")
+    @patch("src.app.transcript_extractor.yt_dlp")
+    def test_get_transcript_ytdlp_subtitle_failures(
+        self, mock_ytdlp, mock_scandir, mock_warning
+    ):
+        mock_ydl_instance = MagicMock(params={})
+        mock_ydl_instance.extract_info.return_value = {
+            "title": "Test Video",
+            "subtitles": {"en": [{"ext": "vtt", "url": "https://example.com/sub"}]},
+        }
+        mock_ytdlp.YoutubeDL.return_value = mock_ydl_instance
+        mock_scandir.return_value.__enter__.return_value = []
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/sub", status_code=404)
+            self.assertIsNone(self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ"))
+        mock_warning.assert_called_once()
+        self.assertIn("subtitle format vtt", mock_warning.call_args.args[0])
+
+        # Failures are not cached, so the next request extracts again
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com/sub", text="WEBVTT\n\n00:00.000 --> 00:01.000\nhi"
+            )
+            transcript = self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ")
+        self.assertEqual(transcript[0]["text"], "hi")
+        self.assertEqual(self.extractor.video_info["title"], "Test Video")
+        self.assertEqual(mock_ydl_instance.extract_info.call_count, 2)
+        mock_warning.assert_called_once()
 
     @patch("src.app.transcript_extractor.yt_dlp")
     def test_get_transcript_ytdlp_failure(self, mock_ytdlp):
         mock_ydl_instance = MagicMock()
         mock_ydl_instance.extract_info.side_effect = Exception("yt-dlp Error")
-        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ytdlp.YoutubeDL.return_value = mock_ydl_instance
         transcript = self.extractor.get_transcript_ytdlp("dQw4w9WgXcQ")
         self.assertIsNone(transcript)
 
-    @patch(
-        "src.app.transcript_extractor.YouTubeTranscriptExtractor.get_transcript_youtube_api"
-    )
-    @patch(
-        "src.app.transcript_extractor.YouTubeTranscriptExtractor.get_transcript_ytdlp"
-    )
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_youtube_api")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_ytdlp")
     def test_extract_transcript_api_success(self, mock_ytdlp, mock_api):
-        mock_api.return_value = [{"text": "api transcript"}]
+        mock_api.return_value = ([{"text": "api transcript"}], None, [])
         transcript, status = self.extractor.extract_transcript(
             "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         )
@@ -94,20 +336,100 @@ class TestYouTubeTranscriptExtractor(unittest.TestCase):
         self.assertIn("Success using YouTube Transcript API", status)
         mock_ytdlp.assert_not_called()
 
-    @patch(
-        "src.app.transcript_extractor.YouTubeTranscriptExtractor.get_transcript_youtube_api"
-    )
-    @patch(
-        "src.app.transcript_extractor.YouTubeTranscriptExtractor.get_transcript_ytdlp"
-    )
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_youtube_api")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_ytdlp")
     def test_extract_transcript_fallback_to_ytdlp(self, mock_ytdlp, mock_api):
-        mock_api.return_value = None
-        mock_ytdlp.return_value = [{"text": "ytdlp transcript"}]
-        transcript, status = self.extractor.extract_transcript(
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        mock_api.return_value = (None, None, [("error", "API failed")])
+        mock_ytdlp.return_value = (
+            [{"text": "ytdlp transcript"}],
+            {"video_id": "dQw4w9WgXcQ", "title": "Test Video"},
+            [],
         )
+        with patch("src.app.transcript_extractor.st.error") as mock_error:
+            transcript, status = self.extractor.extract_transcript(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+            )
         self.assertIsNotNone(transcript)
         self.assertIn("Success using yt-dlp", status)
+        self.assertEqual(self.extractor.video_info["title"], "Test Video")
+        mock_error.assert_called_once_with("API failed")
+
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_youtube_api")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_ytdlp")
+    def test_extract_transcript_api_success_skips_ytdlp(self, mock_ytdlp, mock_api):
+        mock_api.return_value = ([{"text": "api transcript"}], None, [])
+        self.extractor.extract_transcript("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        mock_ytdlp.assert_not_called()
+
+    @patch("src.app.transcript_extractor.FALLBACK_HEDGE_DELAY", 0)
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_youtube_api")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_ytdlp")
+    def test_extract_transcript_slow_api_races_ytdlp(self, mock_ytdlp, mock_api):
+        release = threading.Event()
+
+        def slow_api(*args):
+            release.wait(5)
+            return None, None, [("error", "API failed late")]
+
+        mock_api.side_effect = slow_api
+        mock_ytdlp.return_value = ([{"text": "ytdlp transcript"}], {}, [])
+        with patch("src.app.transcript_extractor.st.error") as mock_error:
+            transcript, status = self.extractor.extract_transcript(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+            )
+            release.set()
+        self.assertEqual(transcript[0]["text"], "ytdlp transcript")
+        self.assertIn("Success using yt-dlp", status)
+        # The abandoned API attempt reports nothing
+        mock_error.assert_not_called()
+
+    @patch("src.app.transcript_extractor.st")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_youtube_api")
+    @patch("src.app.transcript_extractor.YouTubeTranscriptExtractor._try_ytdlp")
+    def test_extract_transcripts(self, mock_ytdlp, mock_api, mock_st):
+        def fake_api(video_id, *args):
+            if video_id == "missingvid0":
+                return None, None, [("error", "Transcripts disabled")]
+            return [{"text": video_id}], None, []
+
+        def fake_ytdlp(video_id, *args):
+            if video_id == "missingvid0":
+                return [{"text": "ytdlp transcript"}], {}, []
+            return None, None, [("error", "yt-dlp failed")]
+
+        mock_api.side_effect = fake_api
+        mock_ytdlp.side_effect = fake_ytdlp
+        results = self.extractor.extract_transcripts(
+            [
+                "https://youtu.be/dQw4w9WgXcQ",
+                "https://youtu.be/missingvid0",
+                "not a url",
+                "https://youtu.be/9bZkp7q19f0",
+            ]
+        )
+        self.assertEqual(results[0][0][0]["text"], "dQw4w9WgXcQ")
+        self.assertEqual(results[1][0][0]["text"], "ytdlp transcript")
+        self.assertIn("Success using yt-dlp", results[1][1])
+        self.assertEqual(results[2], (None, "Invalid YouTube URL"))
+        self.assertEqual(results[3][0][0]["text"], "9bZkp7q19f0")
+        mock_ytdlp.assert_called_once_with("missingvid0", False, None)
+        self.assertEqual(mock_st.mock_calls, [])
+        self.assertIsNone(self.extractor.transcript_data)
+        self.assertIsNone(self.extractor.video_info)
+
+    def test_download_and_parse_subtitle(self):
+        vtt = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello there\n"
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/subs.vtt", status_code=404)
+            m.get("https://example.com/subs.srv3", text=vtt)
+            transcript = self.extractor._download_and_parse_subtitle(
+                [
+                    {"ext": "srv3", "url": "https://example.com/subs.srv3"},
+                    {"ext": "vtt", "url": "https://example.com/subs.vtt"},
+                ]
+            )
+            self.assertIn("gzip", m.request_history[0].headers["Accept-Encoding"])
+        self.assertEqual(transcript[0]["text"], "Hello there")
 
     def test_parse_vtt_content(self):
         vtt_content = """WEBVTT
@@ -125,6 +447,17 @@ this is a test"""
         self.assertEqual(transcript[1]["text"], "this is a test")
         self.assertEqual(transcript[1]["start"], 1.0)
 
+    def test_parse_vtt_content_cue_settings(self):
+        vtt_content = (
+            "WEBVTT\n\n"
+            "00:00:01.000 --> 00:00:03.500 align:start position:0%\n"
+            "hello<00:00:02.000><c> world</c>\n"
+        )
+
+        transcript = self.extractor._parse_vtt_content(vtt_content)
+        self.assertEqual(transcript[0]["text"], "hello world")
+        self.assertEqual(transcript[0]["duration"], 2.5)
+
     def test_parse_srt_content(self):
         srt_content = """1
 00:00:00,000 --> 00:00:01,000
@@ -141,12 +474,36 @@ this is a test"""
         self.assertEqual(transcript[1]["text"], "this is a test")
         self.assertEqual(transcript[1]["start"], 1.0)
 
+    def test_parse_srt_content_crlf(self):
+        srt_content = (
+            "1\r\n00:00:00,000 --> 00:00:01,000\r\nhello\r\n\r\n"
+            "2\r\n00:00:01,000 --> 00:00:02,500\r\n<i>world</i>\r\n"
+        )
+
+        transcript = self.extractor._parse_srt_content(srt_content)
+        self.assertEqual([entry["text"] for entry in transcript], ["hello", "world"])
+        self.assertEqual(transcript[1]["duration"], 1.5)
+
     def test_parse_timestamp(self):
         # Test VTT timestamp parsing
         self.assertEqual(self.extractor._parse_timestamp("00:00:01.500"), 1.5)
         self.assertEqual(self.extractor._parse_timestamp("00:01:30.250"), 90.25)
         self.assertEqual(self.extractor._parse_timestamp("01:00:00.000"), 3600.0)
 
+    def test_parse_timestamp_non_fixed_width(self):
+        # Layouts other than HH:MM:SS.mmm fall back to the general parser
+        self.assertEqual(self.extractor._parse_timestamp("01:30.250"), 90.25)
+        self.assertEqual(self.extractor._parse_timestamp("100:00:00.5"), 360000.5)
+        self.assertEqual(self.extractor._parse_timestamp("00:0x:01.500"), 0.0)
+        self.assertEqual(self.extractor._parse_timestamp("00:+1:01.5"), 0.0)
+        self.assertEqual(self.extractor._parse_timestamp("00::01.5"), 0.0)
+
+    def test_parse_timestamp_cached(self):
+        _parse_fixed_timestamp.cache_clear()
+        self.extractor._parse_timestamp("00:00:01.500")
+        self.assertEqual(self.extractor._parse_timestamp("00:00:01.500"), 1.5)
+        self.assertEqual(_parse_fixed_timestamp.cache_info().hits, 1)
+
     def test_parse_srt_timestamp(self):
         # Test SRT timestamp parsing
         self.assertEqual(self.extractor._parse_srt_timestamp("00:00:01,500"), 1.5)
@@ -0,0 +1,84 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import unittest
+from src.app.utils import (
+    annotated_transcript_text,
+    format_timestamp,
+    paragraphs_text,
+    segment_paragraphs,
+)
+
+
+class TestUtils(unittest.TestCase):
+
+    def test_format_timestamp(self):
+        self.assertEqual(format_timestamp(0), "00:00")
+        self.assertEqual(format_timestamp(75.9), "01:15")
+        self.assertEqual(format_timestamp(6000), "100:00")
+
+    def test_segment_paragraphs(self):
+        transcript = (
+            (0.0, " Hello there. "),
+            (2.0, "this is"),
+            (4.0, "a long"),
+            (6.0, "run on"),
+            (8.0, "Done!"),
+            (65.0, "trailing"),
+        )
+        paragraphs = segment_paragraphs(transcript)
+        self.assertEqual(
+            [paragraph["text"] for paragraph in paragraphs],
+            ["Hello there.", "this is a long run on", "Done!", "trailing"],
+        )
+        self.assertEqual(
+            [paragraph["timestamp"] for paragraph in paragraphs],
+            ["00:00", "00:02", "00:08", "01:05"],
+        )
+        self.assertEqual(paragraphs[1]["start_time"], 2.0)
+
+    def test_segment_paragraphs_cjk_terminators(self):
+        transcript = ((0.0, "你好。"), (1.0, "谢谢！"), (2.0, "是吗？"))
+        paragraphs = segment_paragraphs(transcript)
+        self.assertEqual(
+            [paragraph["text"] for paragraph in paragraphs],
+            ["你好。", "谢谢！", "是吗？"],
+        )
+
+    def test_segment_paragraphs_escapes_html(self):
+        paragraphs = segment_paragraphs(((0.0, "<b>Tom & Jerry</b>."),))
+        self.assertEqual(paragraphs[0]["text"], "<b>Tom & Jerry</b>.")
+        self.assertEqual(paragraphs[0]["html"], "&lt;b&gt;Tom &amp; Jerry&lt;/b&gt;.")
+
+    def test_segment_paragraphs_preview(self):
+        long_text = "word " * 30 + "end."
+        paragraphs = segment_paragraphs(((0.0, "Short."), (1.0, long_text)))
+        self.assertEqual(paragraphs[0]["preview"], "Short.")
+        self.assertEqual(paragraphs[1]["preview"], long_text[:100] + "...")
+
+    def test_segment_paragraphs_empty(self):
+        self.assertEqual(segment_paragraphs(()), [])
+
+    def test_paragraphs_text(self):
+        transcript = ((0.0, "First one."), (2.0, "Second"), (4.0, "one."))
+        self.assertEqual(paragraphs_text(transcript), "First one.\n\nSecond one.")
+
+    def test_annotated_transcript_text(self):
+        transcript = ((0.0, "First one."), (2.0, "Second one."))
+        self.assertEqual(
+            annotated_transcript_text(transcript, ()), "First one.\n\nSecond one."
+        )
+        self.assertEqual(
+            annotated_transcript_text(transcript, ((1, "check this"),)),
+            "First one.\n\n"
+            "--- NOTE SECTION START ---\n"
+            "Second one.\n"
+            '"check this"\n'
+            "--- NOTE SECTION END ---",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()